@@ -1,7 +1,9 @@
 """Alembic environment configuration for async SQLAlchemy."""
 
 import asyncio
+import sys
 from logging.config import fileConfig
+from pathlib import Path
 
 from sqlalchemy import pool
 from sqlalchemy.engine import Connection
@@ -9,18 +11,15 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
 
-# Import your app's configuration and models
-import sys
-from pathlib import Path
-
 # Add parent directory to path so we can import app
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
+# Import your app's configuration and models
 from app.core.config import settings
 from app.database.base import Base
 
 # Import all models so Alembic can detect them
-from app.models import (
+from app.models import (  # noqa: F401
     ChatMessage,
     Execution,
     Session,
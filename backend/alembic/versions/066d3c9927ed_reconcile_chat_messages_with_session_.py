@@ -0,0 +1,137 @@
+"""Reconcile chat messages with session conversations
+
+Revision ID: 066d3c9927ed
+Revises: 7ad1492c73d4
+Create Date: 2026-10-14 06:23:09.363280
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '066d3c9927ed'
+down_revision: str | None = '7ad1492c73d4'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# UUIDs are native on PostgreSQL and 16-byte blobs on SQLite
+UUID = sa.Uuid().with_variant(sa.LargeBinary(length=16), "sqlite")
+SQLITE_NOW = sa.text("(STRFTIME('%Y-%m-%d %H:%M:%f000', 'now'))")
+
+
+def _now() -> sa.TextClause:
+    if op.get_context().dialect.name == "sqlite":
+        return SQLITE_NOW
+    return sa.text("now()")
+
+
+def upgrade() -> None:
+    # The old table modelled generic conversations that nothing wrote to;
+    # the API has always read and written session-scoped messages, so the
+    # table is replaced rather than converted.
+    op.drop_table("chat_messages")
+    op.create_table(
+        "chat_messages",
+        sa.Column("id", UUID, nullable=False),
+        sa.Column("session_id", UUID, nullable=False),
+        sa.Column("direction", sa.String(length=32), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("sender_worker_id", UUID, nullable=True),
+        sa.Column("in_reply_to_id", UUID, nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=_now(),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["session_id"], ["sessions.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(
+            ["sender_worker_id"], ["workers.id"], ondelete="SET NULL"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_chat_messages_created_at"),
+        "chat_messages",
+        ["created_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_chat_messages_in_reply_to_id"),
+        "chat_messages",
+        ["in_reply_to_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_chat_messages_sender_worker_id"),
+        "chat_messages",
+        ["sender_worker_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_chat_messages_session_id_created_at",
+        "chat_messages",
+        ["session_id", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("chat_messages")
+    op.create_table(
+        "chat_messages",
+        sa.Column("id", UUID, nullable=False),
+        sa.Column("conversation_id", UUID, nullable=False),
+        sa.Column("sender_type", sa.String(length=32), nullable=False),
+        sa.Column("sender_id", UUID, nullable=False),
+        sa.Column("message", sa.Text(), nullable=False),
+        sa.Column("message_type", sa.String(length=32), nullable=False),
+        sa.Column("parent_message_id", UUID, nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=_now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_chat_messages_created_at"),
+        "chat_messages",
+        ["created_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_chat_messages_message_type"),
+        "chat_messages",
+        ["message_type"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_chat_messages_parent_message_id"),
+        "chat_messages",
+        ["parent_message_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_chat_messages_sender_id"),
+        "chat_messages",
+        ["sender_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_chat_messages_sender_type"),
+        "chat_messages",
+        ["sender_type"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_chat_messages_conversation_id_created_at",
+        "chat_messages",
+        ["conversation_id", "created_at"],
+        unique=False,
+    )
@@ -0,0 +1,38 @@
+"""Add index for pending worker messages
+
+Revision ID: 12c03b1e6efb
+Revises: 9b795b1368f5
+Create Date: 2026-10-14 06:31:36.658150
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '12c03b1e6efb'
+down_revision: str | None = '9b795b1368f5'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the table writable while the index builds on
+    # Postgres, but can't run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_chat_messages_direction_in_reply_to_id_created_at",
+            "chat_messages",
+            ["direction", "in_reply_to_id", "created_at"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_chat_messages_direction_in_reply_to_id_created_at",
+            table_name="chat_messages",
+            postgresql_concurrently=True,
+        )
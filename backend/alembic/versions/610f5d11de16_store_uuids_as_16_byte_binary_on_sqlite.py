@@ -0,0 +1,79 @@
+"""Store UUIDs as 16-byte binary on SQLite
+
+Revision ID: 610f5d11de16
+Revises: 8977ae788e66
+Create Date: 2026-10-14 05:55:25.661025
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '610f5d11de16'
+down_revision: str | None = '8977ae788e66'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# PostgreSQL already stores these columns as native UUID; only SQLite needs
+# converting from 32-character hex strings to 16-byte blobs.
+UUID_COLUMNS = {
+    "chat_messages": ["id", "conversation_id", "sender_id", "parent_message_id"],
+    "tasks": ["id"],
+    "workers": ["id"],
+    "sessions": ["id", "worker_id", "task_id"],
+    "work_orders": ["id", "task_id", "worker_id"],
+    "executions": ["id", "task_id", "worker_id", "session_id"],
+}
+
+
+def _convert(table: str, columns: list[str], to_bytes: bool) -> None:
+    """Rewrite UUID values of the given columns between hex and bytes."""
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text(f"SELECT rowid, {', '.join(columns)} FROM {table}")
+    ).all()
+    assignments = ", ".join(f"{column} = :{column}" for column in columns)
+    for rowid, *values in rows:
+        params = {"rowid": rowid}
+        for column, value in zip(columns, values, strict=True):
+            if value is not None:
+                value = bytes.fromhex(value) if to_bytes else bytes(value).hex()
+            params[column] = value
+        bind.execute(
+            sa.text(f"UPDATE {table} SET {assignments} WHERE rowid = :rowid"),
+            params,
+        )
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != "sqlite":
+        return
+
+    for table, columns in UUID_COLUMNS.items():
+        _convert(table, columns, to_bytes=True)
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.Uuid(),
+                    type_=sa.LargeBinary(length=16),
+                )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "sqlite":
+        return
+
+    for table, columns in reversed(UUID_COLUMNS.items()):
+        _convert(table, columns, to_bytes=False)
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.LargeBinary(length=16),
+                    type_=sa.Uuid(),
+                )
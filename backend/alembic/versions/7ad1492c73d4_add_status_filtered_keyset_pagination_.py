@@ -0,0 +1,53 @@
+"""Add status-filtered keyset pagination indexes
+
+Revision ID: 7ad1492c73d4
+Revises: 7e8f27282664
+Create Date: 2026-10-14 06:20:53.711333
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '7ad1492c73d4'
+down_revision: str | None = '7e8f27282664'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# (table, old single-column index, new composite index)
+INDEXES = [
+    ("sessions", "ix_sessions_status", "ix_sessions_status_created_at_id"),
+    ("tasks", "ix_tasks_status", "ix_tasks_status_created_at_id"),
+    ("workers", "ix_workers_status", "ix_workers_status_created_at_id"),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the tables writable while the indexes build on
+    # Postgres, but can't run inside a transaction. The composite index
+    # is created before the one it replaces is dropped.
+    with op.get_context().autocommit_block():
+        for table, old_index, new_index in INDEXES:
+            op.create_index(
+                new_index,
+                table,
+                ["status", "created_at", "id"],
+                unique=False,
+                postgresql_concurrently=True,
+            )
+            op.drop_index(old_index, table_name=table, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, old_index, new_index in reversed(INDEXES):
+            op.create_index(
+                old_index,
+                table,
+                ["status"],
+                unique=False,
+                postgresql_concurrently=True,
+            )
+            op.drop_index(new_index, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,38 @@
+"""Default worker heartbeat to registration time
+
+Revision ID: 7e8f27282664
+Revises: baa5ea72c4e8
+Create Date: 2026-10-14 06:14:22.169063
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '7e8f27282664'
+down_revision: str | None = 'baa5ea72c4e8'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("workers") as batch_op:
+        batch_op.alter_column(
+            "last_heartbeat_at",
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=True,
+            server_default=sa.func.now(),
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("workers") as batch_op:
+        batch_op.alter_column(
+            "last_heartbeat_at",
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=True,
+            server_default=None,
+        )
@@ -0,0 +1,64 @@
+"""Timezone-aware timestamps with server defaults
+
+Revision ID: 803dac04d0fd
+Revises: c42dbd5e318c
+Create Date: 2026-10-14 05:50:54.123614
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '803dac04d0fd'
+down_revision: str | None = 'c42dbd5e318c'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# (table, column, has_server_default)
+TIMESTAMP_COLUMNS = [
+    ("chat_messages", "created_at", True),
+    ("executions", "started_at", True),
+    ("executions", "completed_at", False),
+    ("sessions", "created_at", True),
+    ("sessions", "last_activity_at", True),
+    ("sessions", "terminated_at", False),
+    ("tasks", "created_at", True),
+    ("tasks", "updated_at", True),
+    ("tasks", "completed_at", False),
+    ("work_orders", "enqueued_at", True),
+    ("work_orders", "claimed_at", False),
+    ("work_orders", "completed_at", False),
+    ("workers", "created_at", True),
+    ("workers", "updated_at", True),
+    ("workers", "last_heartbeat_at", False),
+]
+
+
+def upgrade() -> None:
+    for table, column, has_server_default in TIMESTAMP_COLUMNS:
+        extra = {"server_default": sa.func.now()} if has_server_default else {}
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.DateTime(),
+                type_=sa.DateTime(timezone=True),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+                **extra,
+            )
+
+
+def downgrade() -> None:
+    for table, column, has_server_default in reversed(TIMESTAMP_COLUMNS):
+        extra = {"server_default": None} if has_server_default else {}
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.DateTime(timezone=True),
+                type_=sa.DateTime(),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+                **extra,
+            )
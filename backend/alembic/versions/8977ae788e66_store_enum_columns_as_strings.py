@@ -0,0 +1,100 @@
+"""Store enum columns as strings
+
+Revision ID: 8977ae788e66
+Revises: 803dac04d0fd
+Create Date: 2026-10-14 05:52:35.453096
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8977ae788e66'
+down_revision: str | None = '803dac04d0fd'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# (table, column, enum type name, enum member names)
+ENUM_COLUMNS = [
+    ("chat_messages", "sender_type", "sendertype", ["WORKER", "HUMAN", "SYSTEM"]),
+    (
+        "chat_messages",
+        "message_type",
+        "messagetype",
+        ["REQUEST", "RESPONSE", "STATUS", "ERROR"],
+    ),
+    ("executions", "status", "executionstatus", ["RUNNING", "COMPLETED", "FAILED"]),
+    ("sessions", "status", "sessionstatus", ["ACTIVE", "IDLE", "TERMINATED"]),
+    (
+        "tasks",
+        "task_type",
+        "tasktype",
+        ["FEATURE", "BUGFIX", "TEST", "DOCS", "REFACTOR", "REVIEW"],
+    ),
+    (
+        "tasks",
+        "status",
+        "taskstatus",
+        ["QUEUED", "IN_PROGRESS", "COMPLETED", "FAILED", "CANCELLED"],
+    ),
+    ("tasks", "priority", "taskpriority", ["LOW", "NORMAL", "HIGH", "CRITICAL"]),
+    (
+        "work_orders",
+        "status",
+        "workorderstatus",
+        ["QUEUED", "CLAIMED", "COMPLETED", "FAILED"],
+    ),
+    ("work_orders", "priority", "workorderpriority", ["LOW", "NORMAL", "HIGH"]),
+    (
+        "workers",
+        "status",
+        "workerstatus",
+        ["IDLE", "BUSY", "WAITING", "ERROR", "OFFLINE"],
+    ),
+]
+
+
+def upgrade() -> None:
+    is_postgresql = op.get_context().dialect.name == "postgresql"
+
+    # SQLAlchemy's Enum stored member names ("IN_PROGRESS"); the string
+    # columns store member values, which are the lowercased names.
+    for table, column, type_name, members in ENUM_COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.Enum(*members, name=type_name),
+                type_=sa.String(length=32),
+                existing_nullable=False,
+                postgresql_using=f"lower({column}::text)",
+            )
+        if not is_postgresql:
+            op.execute(f"UPDATE {table} SET {column} = lower({column})")
+
+    if is_postgresql:
+        for _, _, type_name, members in ENUM_COLUMNS:
+            sa.Enum(*members, name=type_name).drop(op.get_bind(), checkfirst=False)
+
+
+def downgrade() -> None:
+    is_postgresql = op.get_context().dialect.name == "postgresql"
+
+    if is_postgresql:
+        for _, _, type_name, members in ENUM_COLUMNS:
+            sa.Enum(*members, name=type_name).create(op.get_bind(), checkfirst=False)
+
+    for table, column, type_name, members in reversed(ENUM_COLUMNS):
+        if not is_postgresql:
+            op.execute(f"UPDATE {table} SET {column} = upper({column})")
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.String(length=32),
+                type_=sa.Enum(*members, name=type_name),
+                existing_nullable=False,
+                postgresql_using=f"upper({column})::{type_name}",
+            )
@@ -0,0 +1,62 @@
+"""Replace pending messages index with partial index
+
+Revision ID: 93de8c574d35
+Revises: 12c03b1e6efb
+Create Date: 2026-10-14 06:48:30.586300
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '93de8c574d35'
+down_revision: str | None = '12c03b1e6efb'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# Pending worker messages: from the worker and not a reply themselves
+PENDING_PREDICATE = sa.text(
+    "direction = 'worker_to_human' AND in_reply_to_id IS NULL"
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the table writable while the indexes change on
+    # Postgres, but can't run inside a transaction. The partial index is
+    # built before the full one is dropped so the query is never left
+    # without an index
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_chat_messages_pending",
+            "chat_messages",
+            ["created_at"],
+            unique=False,
+            postgresql_where=PENDING_PREDICATE,
+            sqlite_where=PENDING_PREDICATE,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_chat_messages_direction_in_reply_to_id_created_at",
+            table_name="chat_messages",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_chat_messages_direction_in_reply_to_id_created_at",
+            "chat_messages",
+            ["direction", "in_reply_to_id", "created_at"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_chat_messages_pending",
+            table_name="chat_messages",
+            postgresql_concurrently=True,
+        )
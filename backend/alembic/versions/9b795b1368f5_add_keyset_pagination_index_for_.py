@@ -0,0 +1,51 @@
+"""Add keyset pagination index for conversations
+
+Revision ID: 9b795b1368f5
+Revises: 066d3c9927ed
+Create Date: 2026-10-14 06:26:35.177304
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '9b795b1368f5'
+down_revision: str | None = '066d3c9927ed'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the table writable while the index builds on
+    # Postgres, but can't run inside a transaction. The new index is
+    # created before the one it replaces is dropped.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_chat_messages_session_id_created_at_id",
+            "chat_messages",
+            ["session_id", "created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_chat_messages_session_id_created_at",
+            table_name="chat_messages",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_chat_messages_session_id_created_at",
+            "chat_messages",
+            ["session_id", "created_at"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_chat_messages_session_id_created_at_id",
+            table_name="chat_messages",
+            postgresql_concurrently=True,
+        )
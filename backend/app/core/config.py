@@ -1,5 +1,7 @@
 """Application configuration settings."""
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -21,20 +23,44 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./agentvine.db"
     DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_POOL_TIMEOUT: int = 30  # seconds
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT: float = 5.0  # seconds
+    # Work claims long-poll with BLPOP, holding a connection for the whole
+    # wait, so they get a separate pool sized for the number of polling
+    # workers rather than sharing the general one
+    REDIS_BLOCKING_MAX_CONNECTIONS: int = 200
 
     # API
     API_V1_PREFIX: str = "/api/v1"
 
     # CORS
-    CORS_ORIGINS: list[str] = [
+    CORS_ORIGINS: tuple[str, ...] = (
         "http://localhost:3000",
         "http://localhost:5173",
         "http://127.0.0.1:3000",
         "http://127.0.0.1:5173",
-    ]
+    )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the cached application settings.
+
+    The environment and ``.env`` file are only parsed on the first call.
+    Can be used as a FastAPI dependency and overridden in tests via
+    ``app.dependency_overrides[get_settings]``.
+
+    Returns:
+        Settings: Application settings.
+    """
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
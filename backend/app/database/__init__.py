@@ -1,6 +1,28 @@
 """Database configuration and session management."""
 
 from app.database.base import Base
-from app.database.session import AsyncSessionLocal, engine, get_db
+from app.database.bulk import bulk_insert
+from app.database.pagination import keyset_paginate, split_page
+from app.database.session import (
+    dispose_engine,
+    get_db,
+    get_engine,
+    get_sessionmaker,
+)
+from app.database.types import GUID, StringEnum, UTCDateTime
+from app.database.upsert import upsert
 
-__all__ = ["Base", "AsyncSessionLocal", "engine", "get_db"]
+__all__ = [
+    "Base",
+    "GUID",
+    "StringEnum",
+    "UTCDateTime",
+    "bulk_insert",
+    "dispose_engine",
+    "get_db",
+    "get_engine",
+    "get_sessionmaker",
+    "keyset_paginate",
+    "split_page",
+    "upsert",
+]
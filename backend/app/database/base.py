@@ -1,9 +1,19 @@
 """SQLAlchemy declarative base."""
 
+import uuid
+from typing import Any
+
 from sqlalchemy.orm import DeclarativeBase
 
+from app.database.types import GUID
+
 
 class Base(DeclarativeBase):
     """Base class for all database models."""
 
-    pass
+    # Store every Mapped[uuid.UUID] column as a compact 16-byte UUID
+    type_annotation_map: dict[Any, Any] = {uuid.UUID: GUID}
+
+    # Fetch server-generated timestamps via RETURNING on INSERT and UPDATE,
+    # so they're available without a follow-up SELECT.
+    __mapper_args__ = {"eager_defaults": True}
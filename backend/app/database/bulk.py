@@ -0,0 +1,41 @@
+"""Bulk write helpers."""
+
+import uuid
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.base import Base
+
+
+async def bulk_insert(
+    session: AsyncSession,
+    model: type[Base],
+    rows: Sequence[dict[str, Any]],
+) -> list[uuid.UUID]:
+    """Insert many rows of a model in as few round-trips as possible.
+
+    Uses an ORM-enabled bulk ``INSERT .. RETURNING``, which SQLAlchemy
+    batches into multi-row statements ("insertmanyvalues") instead of
+    flushing one INSERT per object. Primary keys are generated client-side
+    by the column default (UUIDv7), so no per-row fetch is needed.
+
+    The rows are not added to the identity map and the session is not
+    committed; callers commit as part of their own unit of work.
+
+    Args:
+        session: Database session.
+        model: Mapped model class with an ``id`` primary key.
+        rows: Column values for each row to insert.
+
+    Returns:
+        list[uuid.UUID]: Ids of the inserted rows, in the order of ``rows``.
+    """
+    if not rows:
+        return []
+
+    stmt = insert(model).returning(model.__table__.c.id, sort_by_parameter_order=True)
+    result = await session.execute(stmt, list(rows))
+    return list(result.scalars().all())
@@ -0,0 +1,141 @@
+"""Keyset (cursor) pagination helpers.
+
+List endpoints page on ``(created_at, id)`` in descending order. Each page
+continues strictly after the last row of the previous one, so deep pages cost
+the same index range scan as the first, unlike ``OFFSET`` which has to read
+and discard every skipped row.
+"""
+
+import base64
+import binascii
+import uuid
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Protocol, TypeVar, cast
+
+from sqlalchemy import tuple_, type_coerce
+from sqlalchemy.orm import Mapped
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from app.database.base import Base
+from app.database.types import GUID, UTCDateTime
+
+
+class KeyedModel(Protocol):
+    """Mapped model paged on ``(created_at, id)``."""
+
+    created_at: Mapped[datetime]
+    id: Mapped[uuid.UUID]
+
+
+class KeyedRow(Protocol):
+    """Model instance or column row carrying the sort key of a page."""
+
+    @property
+    def created_at(self) -> datetime: ...
+
+    @property
+    def id(self) -> uuid.UUID: ...
+
+
+RowT = TypeVar("RowT", bound=KeyedRow)
+
+
+def encode_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    """Encode the sort key of a row as an opaque cursor.
+
+    Args:
+        created_at: Creation timestamp of the row.
+        row_id: Primary key of the row.
+
+    Returns:
+        str: URL-safe cursor string.
+    """
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Decode a cursor produced by :func:`encode_cursor`.
+
+    Args:
+        cursor: Cursor string.
+
+    Returns:
+        tuple: ``(created_at, id)`` sort key of the last row of a page.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), uuid.UUID(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from exc
+
+
+def keyset_paginate(
+    stmt: StatementLambdaElement,
+    model: type[Base],
+    cursor: str | None,
+    limit: int,
+) -> StatementLambdaElement:
+    """Order a lambda statement newest first and restrict it to one page.
+
+    The statement is extended with further lambdas, so the compiled SQL is
+    cached per query shape and only the cursor and limit values are bound
+    on each call.
+
+    One row more than ``limit`` is fetched so :func:`split_page` can tell
+    whether another page follows without a separate COUNT.
+
+    Args:
+        stmt: Lambda statement selecting ``model`` or its columns.
+        model: Mapped model with ``created_at`` and ``id`` columns.
+        cursor: Cursor of the previous page, or None for the first page.
+        limit: Page size.
+
+    Returns:
+        StatementLambdaElement: Paginated statement.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    # Class attribute access on a mapped model can't be checked against a
+    # protocol, so the model is narrowed to its sort key columns here
+    keyed = cast(type[KeyedModel], model)
+    stmt += lambda s: s.order_by(keyed.created_at.desc(), keyed.id.desc())
+
+    if cursor is not None:
+        created_at, row_id = decode_cursor(cursor)
+        # Values bound inside a lambda don't pick up the column types from
+        # the comparison, so they are coerced explicitly
+        stmt += lambda s: s.where(
+            tuple_(keyed.created_at, keyed.id)
+            < tuple_(type_coerce(created_at, UTCDateTime), type_coerce(row_id, GUID))
+        )
+
+    page_size = limit + 1
+    stmt += lambda s: s.limit(page_size)
+    return stmt
+
+
+def split_page(rows: Sequence[RowT], limit: int) -> tuple[list[RowT], str | None]:
+    """Split the extra look-ahead row off a page and build the next cursor.
+
+    Args:
+        rows: Rows returned by a query built with :func:`keyset_paginate`;
+            model instances or column rows with ``created_at`` and ``id``.
+        limit: Page size passed to :func:`keyset_paginate`.
+
+    Returns:
+        tuple: The page items and the cursor of the next page, or None if
+            this is the last page.
+    """
+    items = list(rows[:limit])
+    if len(rows) <= limit:
+        return items, None
+
+    last = items[-1]
+    return items, encode_cursor(last.created_at, last.id)
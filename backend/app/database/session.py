@@ -3,55 +3,121 @@
 from collections.abc import AsyncGenerator
 from typing import Any
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
 
-# Create async engine
-# SQLite doesn't support pool_size and max_overflow
-engine_kwargs = {
-    "echo": settings.DB_ECHO,
-}
-
-# Add pooling options only for PostgreSQL
-if "postgresql" in settings.DATABASE_URL:
-    engine_kwargs.update({
-        "pool_pre_ping": True,
-        "pool_size": 10,
-        "max_overflow": 20,
-    })
-
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    **engine_kwargs,
-)
+# Engine and session factory are created lazily on first use, so each
+# process (e.g. a forked uvicorn/gunicorn worker) builds its own pool
+# rather than inheriting sockets from the parent.
+_engine: AsyncEngine | None = None
+_sessionmaker: async_sessionmaker[AsyncSession] | None = None
 
-# Create async session factory
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
+
+def _engine_kwargs() -> dict[str, Any]:
+    """Build engine options for the configured database.
+
+    Returns:
+        dict: Keyword arguments for ``create_async_engine``.
+    """
+    # SQLite doesn't support pool_size and max_overflow
+    engine_kwargs: dict[str, Any] = {
+        "echo": settings.DB_ECHO,
+    }
+
+    # Add pooling options only for PostgreSQL
+    if "postgresql" in settings.DATABASE_URL:
+        engine_kwargs.update({
+            "poolclass": AsyncAdaptedQueuePool,
+            "pool_pre_ping": True,
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            # Recycle before the server/load balancer silently drops idle connections
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+        })
+
+        if "asyncpg" in settings.DATABASE_URL:
+            engine_kwargs["connect_args"] = {
+                # Short OLTP queries don't benefit from JIT compilation
+                "server_settings": {"jit": "off"},
+                "command_timeout": 10,
+            }
+
+    return engine_kwargs
+
+
+def _enable_sqlite_foreign_keys(dbapi_connection: Any, connection_record: Any) -> None:
+    """Turn on foreign key enforcement for a new SQLite connection.
+
+    SQLite ignores ``ON DELETE`` actions unless this pragma is set, and
+    deletes issued as plain DML rely on the database to cascade.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def get_engine() -> AsyncEngine:
+    """Get the process-wide async engine, creating it on first use.
+
+    Returns:
+        AsyncEngine: Database engine.
+    """
+    global _engine
+    if _engine is None:
+        _engine = create_async_engine(settings.DATABASE_URL, **_engine_kwargs())
+        if _engine.dialect.name == "sqlite":
+            event.listen(_engine.sync_engine, "connect", _enable_sqlite_foreign_keys)
+    return _engine
+
+
+def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Get the process-wide session factory, creating it on first use.
+
+    Returns:
+        async_sessionmaker: Factory for database sessions.
+    """
+    global _sessionmaker
+    if _sessionmaker is None:
+        _sessionmaker = async_sessionmaker(
+            get_engine(),
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autocommit=False,
+            autoflush=False,
+        )
+    return _sessionmaker
+
+
+async def dispose_engine() -> None:
+    """Close all pooled connections and drop the engine."""
+    global _engine, _sessionmaker
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _sessionmaker = None
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, Any]:
     """Dependency for getting async database sessions.
 
+    Sessions come from the process-wide factory, so requests reuse the warm
+    connection pool. The session is not committed on the way out; handlers
+    that write are responsible for calling ``commit()`` themselves, so
+    read-only requests never pay for a COMMIT round-trip. Closing the
+    session (on exit of the context manager) rolls back any uncommitted
+    transaction, including when the handler raises.
+
     Yields:
         AsyncSession: Database session instance.
     """
-    async with AsyncSessionLocal() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+    async with get_sessionmaker()() as session:
+        yield session
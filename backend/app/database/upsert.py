@@ -0,0 +1,36 @@
+"""Dialect-specific INSERT .. ON CONFLICT helpers."""
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.base import Base
+
+
+def upsert(
+    session: AsyncSession, model: type[Base]
+) -> postgresql.Insert | sqlite.Insert:
+    """Start an INSERT for a model that can resolve conflicts in place.
+
+    Lets a get-or-create run as a single ``INSERT .. ON CONFLICT ..
+    RETURNING`` statement, instead of a SELECT followed by an INSERT or
+    UPDATE, which also can't race with a concurrent insert of the same key.
+
+    Args:
+        session: Database session the statement will run on.
+        model: Mapped model class to insert into.
+
+    Returns:
+        Insert: Insert construct of the session's dialect.
+
+    Raises:
+        NotImplementedError: If the dialect has no ON CONFLICT support.
+    """
+    # Both dialects' insert() support on_conflict_do_update/do_nothing with
+    # the same signature; they are dispatched explicitly so each keeps its
+    # own return type
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(model)
+    if dialect == "sqlite":
+        return sqlite.insert(model)
+    raise NotImplementedError(f"ON CONFLICT is not supported on {dialect}")
@@ -4,11 +4,21 @@ This module provides the main FastAPI application with CORS middleware,
 router configuration, and API documentation.
 """
 
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Awaitable
+from contextlib import asynccontextmanager
+from typing import cast
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
 
 from app import __version__
 from app.core.config import settings
+from app.core.redis import close_redis, get_redis
+from app.database import dispose_engine, get_engine
 from app.routers import (
     about_router,
     chat_router,
@@ -18,15 +28,73 @@ from app.routers import (
     tasks_router,
     workers_router,
 )
+from app.routers.health import refresh_health_payload
+from app.services.orchestrator import cleanup_idle_sessions_periodically
+from app.services.queue_manager import (
+    QueueManager,
+    requeue_expired_claims_periodically,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Manage application startup and shutdown.
+
+    Pre-establishes the Redis and database connection pools before the
+    first request is served, runs background housekeeping tasks while the
+    app is up, and releases everything on shutdown.
+
+    Args:
+        app: FastAPI application instance.
+
+    Yields:
+        None: Control back to the ASGI server while the app is running.
+    """
+    # Build this process's connection pools and warm them up, so the first
+    # request doesn't pay connect latency
+    redis_client = await get_redis()
+    await cast(Awaitable[bool], redis_client.ping())
+    async with get_engine().begin() as conn:
+        await conn.execute(text("SELECT 1"))
+
+    # Shared by all requests through the get_queue_manager dependency
+    app.state.queue_manager = queue_manager = QueueManager()
+
+    # Keeps the cached /health payload's timestamp current
+    health_refresher = asyncio.create_task(refresh_health_payload())
+    # Marks idle sessions and terminates expired ones
+    session_cleaner = asyncio.create_task(cleanup_idle_sessions_periodically())
+    # Puts claimed jobs whose task was never started back on their queues
+    claim_requeuer = asyncio.create_task(
+        requeue_expired_claims_periodically(queue_manager)
+    )
+
+    yield
+
+    # Stop background tasks before tearing down the pools they may use
+    for background_task in (health_refresher, session_cleaner, claim_requeuer):
+        background_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await background_task
+
+    # Release pooled connections
+    await dispose_engine()
+    await close_redis()
+
 
 # Create FastAPI application instance
 app = FastAPI(
     title="AgentVine API",
     description="Event-driven autonomous development system backend",
     version=__version__,
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json",
+    # Interactive docs and the OpenAPI schema are only served in debug mode.
+    docs_url="/docs" if settings.DEBUG else None,
+    redoc_url="/redoc" if settings.DEBUG else None,
+    openapi_url="/openapi.json" if settings.DEBUG else None,
+    default_response_class=ORJSONResponse,
+    # Routes are registered without trailing slashes; skip the 307 redirect.
+    redirect_slashes=False,
+    lifespan=lifespan,
 )
 
 # Configure CORS middleware for frontend connectivity
@@ -34,8 +102,9 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists keep the middleware off its wildcard-echo path.
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "X-Request-ID"],
 )
 
 # Register routers
@@ -48,37 +117,25 @@ app.include_router(queue_router, prefix=settings.API_V1_PREFIX)
 app.include_router(chat_router, prefix=settings.API_V1_PREFIX)
 
 
-@app.on_event("startup")
-async def startup_event() -> None:
-    """Execute on application startup.
-
-    Perform any necessary initialization tasks such as:
-    - Database connection pool setup
-    - Cache warming
-    - External service health checks
-    """
-    pass
-
-
-@app.on_event("shutdown")
-async def shutdown_event() -> None:
-    """Execute on application shutdown.
-
-    Perform cleanup tasks such as:
-    - Database connection pool closure
-    - Background task cancellation
-    - Resource cleanup
-    """
-    pass
-
-
 if __name__ == "__main__":
+    import os
+
     import uvicorn
 
+    # The reloader only supervises a single process, so extra workers are
+    # only spawned outside of debug mode. Each worker builds its own engine
+    # and Redis pool lazily in the lifespan.
+    workers = 1 if settings.DEBUG else int(
+        os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)
+    )
+
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        loop="uvloop",
+        http="httptools",
+        workers=workers,
+        reload=settings.DEBUG,
         log_level="info"
     )
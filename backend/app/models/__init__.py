@@ -1,15 +1,27 @@
 """Database models and Pydantic schemas for API responses and requests."""
 
+from sqlalchemy.orm import configure_mappers
+
 # Pydantic response models
 from app.models.responses import AboutResponse, HealthResponse
 
-# SQLAlchemy database models
-from app.models.chat_message import ChatMessage, MessageType, SenderType
-from app.models.execution import Execution, ExecutionStatus
-from app.models.session import Session, SessionStatus
-from app.models.task import Task, TaskPriority, TaskStatus, TaskType
+# SQLAlchemy database models, imported in foreign-key dependency order
+# isort: off
 from app.models.worker import Worker, WorkerStatus
-from app.models.work_order import WorkOrder, WorkOrderPriority, WorkOrderStatus
+from app.models.task import Task, TaskPriority, TaskStatus, TaskType
+from app.models.session import Session, SessionStatus
+from app.models.work_order import (
+    WorkOrder,
+    WorkOrderPriority,
+    WorkOrderStatus,
+)
+from app.models.execution import Execution, ExecutionStatus
+from app.models.chat_message import ChatMessage, MessageDirection
+# isort: on
+
+# Resolve relationships once at import, while the process is still
+# single-threaded, instead of lazily on the first query.
+configure_mappers()
 
 __all__ = [
     # Pydantic response models
@@ -28,8 +40,7 @@ __all__ = [
     "WorkOrderStatus",
     "WorkOrderPriority",
     "ChatMessage",
-    "SenderType",
-    "MessageType",
+    "MessageDirection",
     "Execution",
     "ExecutionStatus",
 ]
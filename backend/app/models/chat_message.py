@@ -4,27 +4,12 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, String, Text
+from sqlalchemy import ForeignKey, Index, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column
+from uuid_utils.compat import uuid7
 
 from app.database.base import Base
-
-
-class SenderType(str, enum.Enum):
-    """Type of message sender."""
-
-    WORKER = "worker"
-    HUMAN = "human"
-    SYSTEM = "system"
-
-
-class MessageType(str, enum.Enum):
-    """Type of chat message."""
-
-    REQUEST = "request"
-    RESPONSE = "response"
-    STATUS = "status"
-    ERROR = "error"
+from app.database.types import StringEnum, UTCDateTime
 
 
 class MessageDirection(str, enum.Enum):
@@ -34,54 +19,74 @@ class MessageDirection(str, enum.Enum):
     HUMAN_TO_WORKER = "human_to_worker"
 
 
+# Predicate of the partial pending-messages index. Queries filter on this
+# same clause: the planner only uses a partial index when it can prove the
+# query's WHERE implies the index's, which a bound parameter can't
+PENDING_PREDICATE = text(
+    f"direction = '{MessageDirection.WORKER_TO_HUMAN.value}' "
+    "AND in_reply_to_id IS NULL"
+)
+
+
 class ChatMessage(Base):
-    """Chat message for worker-human communication."""
+    """Chat message exchanged between a worker session and a human."""
 
     __tablename__ = "chat_messages"
+    __table_args__ = (
+        # Keyset pagination of a session's conversation
+        Index(
+            "ix_chat_messages_session_id_created_at_id",
+            "session_id",
+            "created_at",
+            "id",
+        ),
+        # Unanswered worker messages, newest first. Partial, so it only
+        # holds the pending tail instead of every message
+        Index(
+            "ix_chat_messages_pending",
+            "created_at",
+            postgresql_where=PENDING_PREDICATE,
+            sqlite_where=PENDING_PREDICATE,
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True,
-        default=uuid.uuid4,
-    )
-    conversation_id: Mapped[uuid.UUID] = mapped_column(
-        nullable=False,
-        index=True,
+        default=uuid7,
     )
-    sender_type: Mapped[SenderType] = mapped_column(
-        Enum(SenderType),
+    session_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("sessions.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
-    sender_id: Mapped[uuid.UUID] = mapped_column(
+    direction: Mapped[MessageDirection] = mapped_column(
+        StringEnum(MessageDirection),
         nullable=False,
-        index=True,
     )
-    message: Mapped[str] = mapped_column(
+    content: Mapped[str] = mapped_column(
         Text,
         nullable=False,
     )
-    message_type: Mapped[MessageType] = mapped_column(
-        Enum(MessageType),
-        nullable=False,
-        default=MessageType.REQUEST,
+    sender_worker_id: Mapped[uuid.UUID | None] = mapped_column(
+        ForeignKey("workers.id", ondelete="SET NULL"),
+        nullable=True,
         index=True,
     )
-    parent_message_id: Mapped[uuid.UUID | None] = mapped_column(
+    in_reply_to_id: Mapped[uuid.UUID | None] = mapped_column(
         nullable=True,
         index=True,
     )
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        UTCDateTime,
         nullable=False,
-        default=datetime.utcnow,
+        server_default=func.now(),
         index=True,
     )
 
     def __repr__(self) -> str:
         """Return string representation of ChatMessage."""
         return (
-            f"<ChatMessage(id={self.id}, sender_type={self.sender_type}, "
-            f"message_type={self.message_type})>"
+            f"<ChatMessage(id={self.id}, session_id={self.session_id}, "
+            f"direction={self.direction})>"
         )
@@ -5,10 +5,12 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Text
+from sqlalchemy import ForeignKey, Index, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from uuid_utils.compat import uuid7
 
 from app.database.base import Base
+from app.database.types import StringEnum, UTCDateTime
 
 if TYPE_CHECKING:
     from app.models.session import Session
@@ -28,15 +30,18 @@ class Execution(Base):
     """Execution log for task execution by worker."""
 
     __tablename__ = "executions"
+    __table_args__ = (
+        # Execution history of a task in chronological order
+        Index("ix_executions_task_id_started_at", "task_id", "started_at"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     task_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("tasks.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     worker_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("workers.id", ondelete="CASCADE"),
@@ -49,7 +54,7 @@ class Execution(Base):
         index=True,
     )
     status: Mapped[ExecutionStatus] = mapped_column(
-        Enum(ExecutionStatus),
+        StringEnum(ExecutionStatus),
         nullable=False,
         default=ExecutionStatus.RUNNING,
         index=True,
@@ -61,13 +66,13 @@ class Execution(Base):
 
     # Timestamps
     started_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        UTCDateTime,
         nullable=False,
-        default=datetime.utcnow,
+        server_default=func.now(),
         index=True,
     )
     completed_at: Mapped[datetime | None] = mapped_column(
-        DateTime,
+        UTCDateTime,
         nullable=True,
     )
 
@@ -7,7 +7,7 @@ providing complete type safety and automatic OpenAPI documentation.
 from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class HealthResponse(BaseModel):
@@ -25,14 +25,15 @@ class HealthResponse(BaseModel):
         description="Current server timestamp in ISO 8601 format"
     )
 
-    class Config:
-        """Pydantic configuration."""
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "status": "healthy",
                 "timestamp": "2025-11-18T12:00:00.000Z"
             }
-        }
+        },
+    )
 
 
 class AboutResponse(BaseModel):
@@ -54,12 +55,13 @@ class AboutResponse(BaseModel):
         description="Application description"
     )
 
-    class Config:
-        """Pydantic configuration."""
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "name": "AgentVine",
                 "version": "0.01",
                 "description": "Event-driven autonomous development system"
             }
-        }
+        },
+    )
@@ -5,10 +5,12 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from uuid_utils.compat import uuid7
 
 from app.database.base import Base
+from app.database.types import StringEnum, UTCDateTime
 
 if TYPE_CHECKING:
     from app.models.execution import Execution
@@ -28,10 +30,18 @@ class Session(Base):
     """Claude Code session mapping to task."""
 
     __tablename__ = "sessions"
+    __table_args__ = (
+        # Sessions of a worker filtered by status
+        Index("ix_sessions_worker_id_status", "worker_id", "status"),
+        # Keyset pagination of the session list, newest first
+        Index("ix_sessions_created_at_id", "created_at", "id"),
+        # Same, filtered by status
+        Index("ix_sessions_status_created_at_id", "status", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     session_id: Mapped[str] = mapped_column(
         String(255),
@@ -42,7 +52,6 @@ class Session(Base):
     worker_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("workers.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     task_id: Mapped[uuid.UUID | None] = mapped_column(
         ForeignKey("tasks.id", ondelete="SET NULL"),
@@ -50,26 +59,26 @@ class Session(Base):
         index=True,
     )
     status: Mapped[SessionStatus] = mapped_column(
-        Enum(SessionStatus),
+        StringEnum(SessionStatus),
         nullable=False,
         default=SessionStatus.ACTIVE,
-        index=True,
     )
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        UTCDateTime,
         nullable=False,
-        default=datetime.utcnow,
+        server_default=func.now(),
     )
     last_activity_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        UTCDateTime,
         nullable=False,
-        default=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
         index=True,
     )
     terminated_at: Mapped[datetime | None] = mapped_column(
-        DateTime,
+        UTCDateTime,
         nullable=True,
     )
 
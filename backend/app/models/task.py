@@ -5,10 +5,12 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Enum, String, Text
+from sqlalchemy import Index, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from uuid_utils.compat import uuid7
 
 from app.database.base import Base
+from app.database.types import StringEnum, UTCDateTime
 
 if TYPE_CHECKING:
     from app.models.execution import Execution
@@ -49,26 +51,31 @@ class Task(Base):
     """Development task to be executed by workers."""
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Keyset pagination of the task list, newest first
+        Index("ix_tasks_created_at_id", "created_at", "id"),
+        # Same, filtered by status
+        Index("ix_tasks_status_created_at_id", "status", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
     task_type: Mapped[TaskType] = mapped_column(
-        Enum(TaskType),
+        StringEnum(TaskType),
         nullable=False,
         default=TaskType.FEATURE,
     )
     status: Mapped[TaskStatus] = mapped_column(
-        Enum(TaskStatus),
+        StringEnum(TaskStatus),
         nullable=False,
         default=TaskStatus.QUEUED,
-        index=True,
     )
     priority: Mapped[TaskPriority] = mapped_column(
-        Enum(TaskPriority),
+        StringEnum(TaskPriority),
         nullable=False,
         default=TaskPriority.NORMAL,
         index=True,
@@ -78,19 +85,18 @@ class Task(Base):
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        UTCDateTime,
         nullable=False,
-        default=datetime.utcnow,
-        index=True,
+        server_default=func.now(),
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        UTCDateTime,
         nullable=False,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
     )
     completed_at: Mapped[datetime | None] = mapped_column(
-        DateTime,
+        UTCDateTime,
         nullable=True,
     )
 
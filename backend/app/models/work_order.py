@@ -5,10 +5,12 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer
+from sqlalchemy import ForeignKey, Index, Integer, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from uuid_utils.compat import uuid7
 
 from app.database.base import Base
+from app.database.types import StringEnum, UTCDateTime
 
 if TYPE_CHECKING:
     from app.models.task import Task
@@ -36,10 +38,19 @@ class WorkOrder(Base):
     """Work order representing queued task execution."""
 
     __tablename__ = "work_orders"
+    __table_args__ = (
+        # Dispatch: next queued work by priority, oldest first
+        Index(
+            "ix_work_orders_status_priority_enqueued_at",
+            "status",
+            "priority",
+            "enqueued_at",
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     task_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("tasks.id", ondelete="CASCADE"),
@@ -52,13 +63,12 @@ class WorkOrder(Base):
         index=True,
     )
     status: Mapped[WorkOrderStatus] = mapped_column(
-        Enum(WorkOrderStatus),
+        StringEnum(WorkOrderStatus),
         nullable=False,
         default=WorkOrderStatus.QUEUED,
-        index=True,
     )
     priority: Mapped[WorkOrderPriority] = mapped_column(
-        Enum(WorkOrderPriority),
+        StringEnum(WorkOrderPriority),
         nullable=False,
         default=WorkOrderPriority.NORMAL,
         index=True,
@@ -71,17 +81,17 @@ class WorkOrder(Base):
 
     # Timestamps
     enqueued_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        UTCDateTime,
         nullable=False,
-        default=datetime.utcnow,
+        server_default=func.now(),
         index=True,
     )
     claimed_at: Mapped[datetime | None] = mapped_column(
-        DateTime,
+        UTCDateTime,
         nullable=True,
     )
     completed_at: Mapped[datetime | None] = mapped_column(
-        DateTime,
+        UTCDateTime,
         nullable=True,
     )
 
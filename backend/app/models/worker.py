@@ -5,10 +5,12 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Enum, String
+from sqlalchemy import Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from uuid_utils.compat import uuid7
 
 from app.database.base import Base
+from app.database.types import StringEnum, UTCDateTime
 
 if TYPE_CHECKING:
     from app.models.execution import Execution
@@ -30,34 +32,40 @@ class Worker(Base):
     """Claude Code worker instance."""
 
     __tablename__ = "workers"
+    __table_args__ = (
+        # Keyset pagination of the worker list, newest first
+        Index("ix_workers_created_at_id", "created_at", "id"),
+        # Same, filtered by status
+        Index("ix_workers_status_created_at_id", "status", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     status: Mapped[WorkerStatus] = mapped_column(
-        Enum(WorkerStatus),
+        StringEnum(WorkerStatus),
         nullable=False,
         default=WorkerStatus.IDLE,
-        index=True,
     )
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        UTCDateTime,
         nullable=False,
-        default=datetime.utcnow,
+        server_default=func.now(),
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        UTCDateTime,
         nullable=False,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
     )
     last_heartbeat_at: Mapped[datetime | None] = mapped_column(
-        DateTime,
+        UTCDateTime,
         nullable=True,
+        server_default=func.now(),
         index=True,
     )
 
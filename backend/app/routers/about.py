@@ -3,14 +3,41 @@
 Provides information about the AgentVine application.
 """
 
-from fastapi import APIRouter
+from functools import lru_cache
+from typing import Annotated
+
+import orjson
+from fastapi import APIRouter, Depends, Response
 
 from app import __version__
+from app.core.config import Settings, get_settings
 from app.models.responses import AboutResponse
 
 router = APIRouter(tags=["Info"])
 
 
+@lru_cache(maxsize=1)
+def _render_about(name: str) -> bytes:
+    """Serialize the about payload for an application name.
+
+    The payload only changes with the settings, so it is serialized once
+    and served as-is instead of building and validating a model per request.
+
+    Args:
+        name: Application name.
+
+    Returns:
+        bytes: JSON-encoded about payload.
+    """
+    return orjson.dumps(
+        AboutResponse(
+            name=name,
+            version=__version__,
+            description="Event-driven autonomous development system",
+        ).model_dump()
+    )
+
+
 @router.get(
     "/about",
     response_model=AboutResponse,
@@ -18,15 +45,20 @@ router = APIRouter(tags=["Info"])
     description="Returns basic information about the AgentVine application",
     status_code=200,
 )
-async def about() -> AboutResponse:
+async def about(
+    settings: Annotated[Settings, Depends(get_settings)],
+) -> Response:
     """Get information about the AgentVine application.
 
+    Args:
+        settings: Application settings.
+
     Returns:
-        AboutResponse: Application name, version, and description
+        Response: Pre-serialized application name, version, and description
 
     Example:
         ```python
-        response = await about()
+        response = await about(get_settings())
         # {
         #     "name": "AgentVine",
         #     "version": "0.01",
@@ -34,8 +66,4 @@ async def about() -> AboutResponse:
         # }
         ```
     """
-    return AboutResponse(
-        name="AgentVine",
-        version=__version__,
-        description="Event-driven autonomous development system"
-    )
+    return Response(_render_about(settings.APP_NAME), media_type="application/json")
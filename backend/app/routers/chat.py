@@ -1,28 +1,93 @@
 """Chat API endpoints for worker-human communication."""
 
-import uuid
-from typing import Annotated
-
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Annotated, Any, TypeVar
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    status,
+)
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.schemas.chat import (
-    ChatMessageCreate,
-    ChatMessageResponse,
+    ConversationListResponse,
     HumanResponseCreate,
     WorkerMessageRequest,
-    ConversationResponse,
 )
 from app.services.orchestrator import EventOrchestrator
+from app.services.queue_manager import QueueManager, get_queue_manager
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
+BodyT = TypeVar("BodyT", bound=BaseModel)
+
+# Validators for the hot write endpoints, built once at import. Their bodies
+# are parsed straight from the raw bytes instead of through FastAPI's
+# json.loads + per-field validation path.
+_WORKER_MESSAGE_ADAPTER = TypeAdapter(WorkerMessageRequest)
+_HUMAN_RESPONSE_ADAPTER = TypeAdapter(HumanResponseCreate)
+
+
+def _request_body_schema(model: type[BaseModel]) -> dict[str, Any]:
+    """Build the OpenAPI request body for a manually parsed endpoint.
+
+    Args:
+        model: Schema of the JSON body.
+
+    Returns:
+        dict: ``openapi_extra`` documenting the body.
+    """
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
+
+
+async def _parse_body(adapter: TypeAdapter[BodyT], request: Request) -> BodyT:
+    """Validate a JSON request body with a prebuilt adapter.
 
-@router.post("/worker-message", response_model=dict)
+    Args:
+        adapter: Validator for the body schema.
+        request: Incoming request.
+
+    Returns:
+        BaseModel: Validated body.
+
+    Raises:
+        RequestValidationError: If the body is not valid JSON or does not
+            match the schema, reported like FastAPI's own body errors.
+    """
+    try:
+        return adapter.validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in exc.errors(include_url=False)
+            ]
+        ) from exc
+
+
+@router.post(
+    "/worker-message",
+    response_model=dict,
+    openapi_extra=_request_body_schema(WorkerMessageRequest),
+)
 async def send_worker_message(
-    message_data: WorkerMessageRequest,
+    request: Request,
+    background_tasks: BackgroundTasks,
     db: Annotated[AsyncSession, Depends(get_db)],
+    queue_manager: Annotated[QueueManager, Depends(get_queue_manager)],
 ) -> dict:
     """
     Worker sends a message to human (via orchestrator).
@@ -30,44 +95,60 @@ async def send_worker_message(
     Phase 1: All messages are passed through to human chat interface.
 
     Args:
-        message_data: Message from worker
+        request: Incoming request, whose body is the message from worker
+        background_tasks: Tasks run after the response is sent
         db: Database session
+        queue_manager: Shared queue manager
 
     Returns:
         dict with routing information
     """
-    orchestrator = EventOrchestrator(db)
+    message_data = await _parse_body(_WORKER_MESSAGE_ADAPTER, request)
 
-    result = await orchestrator.handle_worker_message(
+    result = await EventOrchestrator.handle_worker_message(
+        db,
+        queue_manager,
         session_id=message_data.session_id,
         worker_id=message_data.worker_id,
         message=message_data.message,
+        background_tasks=background_tasks,
         task_id=message_data.task_id,
     )
 
     return result
 
 
-@router.post("/human-response", response_model=dict)
+@router.post(
+    "/human-response",
+    response_model=dict,
+    openapi_extra=_request_body_schema(HumanResponseCreate),
+)
 async def send_human_response(
-    response_data: HumanResponseCreate,
+    request: Request,
+    background_tasks: BackgroundTasks,
     db: Annotated[AsyncSession, Depends(get_db)],
+    queue_manager: Annotated[QueueManager, Depends(get_queue_manager)],
 ) -> dict:
     """
     Human responds to a worker message.
 
     Args:
-        response_data: Human's response
+        request: Incoming request, whose body is the human's response
+        background_tasks: Tasks run after the response is sent
         db: Database session
+        queue_manager: Shared queue manager
 
     Returns:
         dict with routing information
     """
-    orchestrator = EventOrchestrator(db)
+    response_data = await _parse_body(_HUMAN_RESPONSE_ADAPTER, request)
 
-    result = await orchestrator.handle_human_response(
+    result = await EventOrchestrator.handle_human_response(
+        db,
+        queue_manager,
         message_id=response_data.message_id,
         response=response_data.response,
+        background_tasks=background_tasks,
     )
 
     return result
@@ -77,7 +158,7 @@ async def send_human_response(
 async def get_pending_messages(
     db: Annotated[AsyncSession, Depends(get_db)],
     limit: int = 50,
-) -> list[dict]:
+) -> ORJSONResponse:
     """
     Get pending worker messages awaiting human response.
 
@@ -86,31 +167,50 @@ async def get_pending_messages(
         limit: Maximum number of messages
 
     Returns:
-        list of pending messages
+        list of pending messages, serialized directly with orjson
     """
-    orchestrator = EventOrchestrator(db)
-    messages = await orchestrator.get_pending_worker_messages(limit=limit)
-    return messages
+    messages = await EventOrchestrator.get_pending_worker_messages(db, limit=limit)
+    return ORJSONResponse(messages)
 
 
-@router.get("/conversation/{session_id}", response_model=list[dict])
+@router.get("/conversation/{session_id}", response_model=ConversationListResponse)
 async def get_conversation(
     session_id: str,
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> list[dict]:
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
+    cursor: str | None = None,
+) -> ORJSONResponse:
     """
-    Get full conversation for a session.
+    Get conversation for a session, one page at a time.
+
+    The first page holds the most recent messages; ``next_cursor`` pages
+    back through older ones. Messages within a page are in chronological
+    order.
 
     Args:
         session_id: Claude Code session ID
         db: Database session
+        limit: Maximum number of messages
+        cursor: ``next_cursor`` of the previous page
 
     Returns:
-        list of messages in chronological order
+        page of messages and the cursor of the next page, serialized
+        directly with orjson
+
+    Raises:
+        HTTPException: If the cursor is invalid
     """
-    orchestrator = EventOrchestrator(db)
-    messages = await orchestrator.get_session_conversation(session_id)
-    return messages
+    try:
+        messages, next_cursor = await EventOrchestrator.get_session_conversation(
+            db, session_id, cursor=cursor, limit=limit
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+
+    return ORJSONResponse({"items": messages, "next_cursor": next_cursor})
 
 
 @router.post("/cleanup-sessions", response_model=dict)
@@ -118,13 +218,13 @@ async def cleanup_idle_sessions(
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> dict:
     """
-    Check and cleanup idle sessions.
+    Check and cleanup idle sessions immediately.
 
-    Should be called periodically (e.g., every 5 minutes).
+    The same check already runs in the background every
+    ``SESSION_CLEANUP_INTERVAL`` seconds; this is a manual trigger.
 
     Returns:
         dict with cleanup statistics
     """
-    orchestrator = EventOrchestrator(db)
-    stats = await orchestrator.check_and_cleanup_idle_sessions()
+    stats = await EventOrchestrator.check_and_cleanup_idle_sessions(db)
     return stats
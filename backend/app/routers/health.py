@@ -3,14 +3,52 @@
 Provides a simple health check endpoint for monitoring and load balancers.
 """
 
-from datetime import datetime, timezone
+import asyncio
+from datetime import UTC, datetime
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 
 from app.models.responses import HealthResponse
 
 router = APIRouter(tags=["Health"])
 
+# How often the cached payload's timestamp is refreshed, in seconds
+HEALTH_REFRESH_INTERVAL = 1.0
+
+
+def _render_health() -> bytes:
+    """Serialize the health payload with the current timestamp.
+
+    Returns:
+        bytes: JSON-encoded health payload.
+    """
+    return orjson.dumps(
+        {"status": "healthy", "timestamp": datetime.now(UTC)},
+        option=orjson.OPT_UTC_Z,
+    )
+
+
+# Probes are served from this buffer; it is re-rendered once per interval by
+# refresh_health_payload() rather than on every request
+_health_payload = _render_health()
+
+
+async def refresh_health_payload(
+    interval: float = HEALTH_REFRESH_INTERVAL,
+) -> None:
+    """Keep the cached health payload's timestamp current.
+
+    Runs until cancelled; started and stopped by the application lifespan.
+
+    Args:
+        interval: Seconds between refreshes.
+    """
+    global _health_payload
+    while True:
+        await asyncio.sleep(interval)
+        _health_payload = _render_health()
+
 
 @router.get(
     "/health",
@@ -19,11 +57,13 @@ router = APIRouter(tags=["Health"])
     description="Returns the health status of the service with a timestamp",
     status_code=200,
 )
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """Check the health status of the API.
 
+    The timestamp has a resolution of ``HEALTH_REFRESH_INTERVAL``.
+
     Returns:
-        HealthResponse: Health status and current timestamp
+        Response: Health status and current timestamp as JSON
 
     Example:
         ```python
@@ -31,7 +71,4 @@ async def health_check() -> HealthResponse:
         # {"status": "healthy", "timestamp": "2025-11-18T12:00:00.000Z"}
         ```
     """
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.now(timezone.utc)
-    )
+    return Response(_health_payload, media_type="application/json")
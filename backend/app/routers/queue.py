@@ -1,22 +1,28 @@
 """Queue API endpoints."""
 
-from fastapi import APIRouter
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.schemas.queue import QueueStatsResponse, WorkOrderClaim
-from app.services.queue_manager import QueueManager
+from app.services.queue_manager import QueueManager, get_queue_manager
 
 router = APIRouter(prefix="/queue", tags=["queue"])
 
 
 @router.get("/status", response_model=QueueStatsResponse)
-async def get_queue_status() -> QueueStatsResponse:
+async def get_queue_status(
+    queue_manager: Annotated[QueueManager, Depends(get_queue_manager)],
+) -> QueueStatsResponse:
     """Get queue statistics.
 
+    Args:
+        queue_manager: Shared queue manager.
+
     Returns:
         QueueStatsResponse: Statistics for all queues.
     """
-    queue_manager = QueueManager()
-    stats = queue_manager.get_queue_stats()
+    stats = await queue_manager.get_queue_stats()
 
     return QueueStatsResponse(
         high_priority=stats["high_priority"],
@@ -29,18 +35,30 @@ async def get_queue_status() -> QueueStatsResponse:
 
 @router.post("/claim", response_model=WorkOrderClaim | None)
 async def claim_work(
+    queue_manager: Annotated[QueueManager, Depends(get_queue_manager)],
     queue_names: list[str] | None = None,
 ) -> WorkOrderClaim | None:
     """Claim next available work order.
 
+    Waits up to ``CLAIM_TIMEOUT`` seconds for a job if the queues are empty.
+
     Args:
+        queue_manager: Shared queue manager.
         queue_names: Optional list of queue names to check.
 
     Returns:
         WorkOrderClaim | None: Work order data or None if no work available.
+
+    Raises:
+        HTTPException: If a queue name is invalid.
     """
-    queue_manager = QueueManager()
-    work = queue_manager.claim_work(queue_names)
+    try:
+        work = await queue_manager.claim_work(queue_names)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
 
     if work:
         return WorkOrderClaim(**work)
@@ -1,16 +1,21 @@
 """Session API endpoints."""
 
 import uuid
-from datetime import datetime
-from typing import Annotated
+from collections.abc import Sequence
+from typing import Annotated, Any, cast
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import CursorResult, func, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, keyset_paginate, split_page
 from app.models import Session, SessionStatus
-from app.schemas.session import SessionCreate, SessionResponse
+from app.schemas.orm import construct_from_orm
+from app.schemas.session import (
+    SessionCreate,
+    SessionListResponse,
+    SessionResponse,
+)
 
 router = APIRouter(prefix="/sessions", tags=["sessions"])
 
@@ -34,44 +39,69 @@ async def create_session(
         worker_id=session_data.worker_id,
         task_id=session_data.task_id,
         status=SessionStatus.ACTIVE,
-        last_activity_at=datetime.utcnow(),
     )
 
     db.add(session)
     await db.commit()
-    await db.refresh(session)
 
     return session
 
 
-@router.get("", response_model=list[SessionResponse])
+@router.get("", response_model=SessionListResponse)
 async def list_sessions(
     db: Annotated[AsyncSession, Depends(get_db)],
     status_filter: SessionStatus | None = None,
-) -> list[Session]:
-    """List all sessions.
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
+    cursor: str | None = None,
+) -> Response:
+    """List sessions with optional filtering, newest first.
 
     Args:
         db: Database session.
         status_filter: Optional status filter.
+        limit: Maximum number of results.
+        cursor: ``next_cursor`` of the previous page.
 
     Returns:
-        list[Session]: List of sessions.
+        Response: Serialized SessionListResponse with the page of sessions
+            and the cursor of the next page.
+
+    Raises:
+        HTTPException: If the cursor is invalid.
     """
-    query = select(Session).order_by(Session.created_at.desc())
+    # Built from lambdas so the compiled SQL is cached per query shape
+    stmt = lambda_stmt(lambda: select(Session))
 
     if status_filter:
-        query = query.where(Session.status == status_filter)
+        stmt += lambda s: s.where(Session.status == status_filter)
 
-    result = await db.execute(query)
-    return list(result.scalars().all())
+    try:
+        stmt = keyset_paginate(stmt, Session, cursor, limit)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+
+    result = await db.execute(stmt)
+    # Lambda statements lose the row type, so it is restated here
+    rows: Sequence[Session] = result.scalars().all()
+    items, next_cursor = split_page(rows, limit)
+
+    # Rows are already typed by the ORM; serialize them straight to JSON
+    # without the response validation FastAPI would otherwise run
+    page = SessionListResponse.model_construct(
+        items=[construct_from_orm(SessionResponse, row) for row in items],
+        next_cursor=next_cursor,
+    )
+    return Response(page.model_dump_json(), media_type="application/json")
 
 
 @router.get("/{session_id}", response_model=SessionResponse)
 async def get_session(
     session_id: uuid.UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> Session:
+) -> Response:
     """Get session by ID.
 
     Args:
@@ -79,7 +109,7 @@ async def get_session(
         db: Database session.
 
     Returns:
-        Session: Session instance.
+        Response: Serialized SessionResponse.
 
     Raises:
         HTTPException: If session not found.
@@ -92,7 +122,8 @@ async def get_session(
             detail=f"Session {session_id} not found",
         )
 
-    return session
+    body = construct_from_orm(SessionResponse, session).model_dump_json()
+    return Response(body, media_type="application/json")
 
 
 @router.post("/{session_id}/heartbeat", response_model=SessionResponse)
@@ -112,7 +143,15 @@ async def session_heartbeat(
     Raises:
         HTTPException: If session not found.
     """
-    session = await db.get(Session, session_id)
+    # Bump the timestamp and read the row back in a single statement
+    stmt = (
+        update(Session)
+        .where(Session.id == session_id)
+        .values(last_activity_at=func.now())
+        .returning(Session)
+    )
+    result = await db.execute(stmt)
+    session = result.scalar_one_or_none()
 
     if not session:
         raise HTTPException(
@@ -120,10 +159,7 @@ async def session_heartbeat(
             detail=f"Session {session_id} not found",
         )
 
-    session.last_activity_at = datetime.utcnow()
-
     await db.commit()
-    await db.refresh(session)
 
     return session
 
@@ -142,15 +178,17 @@ async def terminate_session(
     Raises:
         HTTPException: If session not found.
     """
-    session = await db.get(Session, session_id)
+    stmt = (
+        update(Session)
+        .where(Session.id == session_id)
+        .values(status=SessionStatus.TERMINATED, terminated_at=func.now())
+    )
+    result = await db.execute(stmt)
 
-    if not session:
+    if cast(CursorResult[Any], result).rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Session {session_id} not found",
         )
 
-    session.status = SessionStatus.TERMINATED
-    session.terminated_at = datetime.utcnow()
-
     await db.commit()
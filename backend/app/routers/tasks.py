@@ -1,17 +1,37 @@
 """Task API endpoints."""
 
 import uuid
+from collections.abc import Sequence
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Response,
+    status,
+)
+from sqlalchemy import func, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.core.redis import list_queues
+from app.database import get_db, keyset_paginate, split_page
 from app.models import Task, TaskStatus, WorkOrder
 from app.models.work_order import WorkOrderPriority, WorkOrderStatus
-from app.schemas.task import TaskCreate, TaskResponse, TaskUpdate
-from app.services.queue_manager import QueueManager
+from app.schemas.orm import construct_from_orm
+from app.schemas.session import SessionResponse
+from app.schemas.task import (
+    TaskCreate,
+    TaskListResponse,
+    TaskResponse,
+    TaskStart,
+    TaskStartResponse,
+    TaskUpdate,
+)
+from app.services.orchestrator import EventOrchestrator
+from app.services.queue_manager import QueueManager, get_queue_manager
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
@@ -19,24 +39,29 @@ router = APIRouter(prefix="/tasks", tags=["tasks"])
 @router.post("", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
 async def create_task(
     task_data: TaskCreate,
+    background_tasks: BackgroundTasks,
     db: Annotated[AsyncSession, Depends(get_db)],
+    queue_manager: Annotated[QueueManager, Depends(get_queue_manager)],
 ) -> Task:
     """Create a new task and enqueue it.
 
+    The work order is published to Redis after the response is sent.
+
     Args:
         task_data: Task creation data.
+        background_tasks: Tasks run after the response is sent.
         db: Database session.
+        queue_manager: Shared queue manager.
 
     Returns:
         Task: Created task.
     """
-    # Create task
+    # Create task and its work order in one transaction; flushing writes
+    # the task row early (server defaults come back via RETURNING)
     task = Task(**task_data.model_dump())
     db.add(task)
-    await db.commit()
-    await db.refresh(task)
+    await db.flush()
 
-    # Create work order
     work_order = WorkOrder(
         task_id=task.id,
         priority=WorkOrderPriority(task.priority.value),
@@ -44,11 +69,12 @@ async def create_task(
     )
     db.add(work_order)
     await db.commit()
-    await db.refresh(work_order)
 
-    # Enqueue to Redis
-    queue_manager = QueueManager()
-    queue_manager.enqueue_work_order(
+    # Enqueue to Redis only once the rows are committed, so a rollback
+    # never leaves a job pointing at a missing work order, and off the
+    # request path, so the client doesn't wait on the Redis round-trip
+    background_tasks.add_task(
+        queue_manager.enqueue_work_order,
         work_order_id=work_order.id,
         task_data={
             "task_id": str(task.id),
@@ -64,38 +90,61 @@ async def create_task(
     return task
 
 
-@router.get("", response_model=list[TaskResponse])
+@router.get("", response_model=TaskListResponse)
 async def list_tasks(
     db: Annotated[AsyncSession, Depends(get_db)],
     status_filter: TaskStatus | None = None,
-    limit: int = 100,
-    offset: int = 0,
-) -> list[Task]:
-    """List tasks with optional filtering.
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
+    cursor: str | None = None,
+) -> Response:
+    """List tasks with optional filtering, newest first.
 
     Args:
         db: Database session.
         status_filter: Optional status filter.
         limit: Maximum number of results.
-        offset: Number of results to skip.
+        cursor: ``next_cursor`` of the previous page.
 
     Returns:
-        list[Task]: List of tasks.
+        Response: Serialized TaskListResponse with the page of tasks
+            and the cursor of the next page.
+
+    Raises:
+        HTTPException: If the cursor is invalid.
     """
-    query = select(Task).order_by(Task.created_at.desc()).limit(limit).offset(offset)
+    # Built from lambdas so the compiled SQL is cached per query shape
+    stmt = lambda_stmt(lambda: select(Task))
 
     if status_filter:
-        query = query.where(Task.status == status_filter)
+        stmt += lambda s: s.where(Task.status == status_filter)
 
-    result = await db.execute(query)
-    return list(result.scalars().all())
+    try:
+        stmt = keyset_paginate(stmt, Task, cursor, limit)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+
+    result = await db.execute(stmt)
+    # Lambda statements lose the row type, so it is restated here
+    rows: Sequence[Task] = result.scalars().all()
+    items, next_cursor = split_page(rows, limit)
+
+    # Rows are already typed by the ORM; serialize them straight to JSON
+    # without the response validation FastAPI would otherwise run
+    page = TaskListResponse.model_construct(
+        items=[construct_from_orm(TaskResponse, row) for row in items],
+        next_cursor=next_cursor,
+    )
+    return Response(page.model_dump_json(), media_type="application/json")
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: uuid.UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> Task:
+) -> Response:
     """Get task by ID.
 
     Args:
@@ -103,7 +152,7 @@ async def get_task(
         db: Database session.
 
     Returns:
-        Task: Task instance.
+        Response: Serialized TaskResponse.
 
     Raises:
         HTTPException: If task not found.
@@ -116,7 +165,8 @@ async def get_task(
             detail=f"Task {task_id} not found",
         )
 
-    return task
+    body = construct_from_orm(TaskResponse, task).model_dump_json()
+    return Response(body, media_type="application/json")
 
 
 @router.patch("/{task_id}", response_model=TaskResponse)
@@ -138,7 +188,22 @@ async def update_task(
     Raises:
         HTTPException: If task not found.
     """
-    task = await db.get(Task, task_id)
+    update_data = task_data.model_dump(exclude_unset=True)
+
+    # Handle completion timestamp
+    if update_data.get("status") == TaskStatus.COMPLETED:
+        update_data["completed_at"] = func.now()
+
+    # Apply the changes and read the row back, including the server-side
+    # timestamps, in a single statement
+    stmt = (
+        update(Task)
+        .where(Task.id == task_id)
+        .values(**update_data)
+        .returning(Task)
+    )
+    result = await db.execute(stmt)
+    task = result.scalar_one_or_none()
 
     if not task:
         raise HTTPException(
@@ -146,18 +211,66 @@ async def update_task(
             detail=f"Task {task_id} not found",
         )
 
-    # Update fields
-    update_data = task_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(task, field, value)
+    await db.commit()
 
-    # Handle completion timestamp
-    if update_data.get("status") == TaskStatus.COMPLETED:
-        from datetime import datetime
+    return task
+
+
+@router.post("/{task_id}/start", response_model=TaskStartResponse)
+async def start_task(
+    task_id: uuid.UUID,
+    start_data: TaskStart,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    queue_manager: Annotated[QueueManager, Depends(get_queue_manager)],
+) -> TaskStartResponse:
+    """Mark a task in progress and attach it to the worker's session.
+
+    Saves the worker a round trip per task over updating the task status
+    and creating the session separately. The session is upserted, so a
+    worker reusing its session for a new task moves it to that task. The
+    request also counts as a heartbeat reporting the worker busy, and
+    acknowledges the claim of the job the task came from, if given.
 
-        task.completed_at = datetime.utcnow()
+    Args:
+        task_id: Task UUID.
+        start_data: Worker and Claude Code session running the task.
+        db: Database session.
+        queue_manager: Shared queue manager.
+
+    Returns:
+        TaskStartResponse: Updated task and session.
+
+    Raises:
+        HTTPException: If the task or worker is not found, the task or
+            session belongs to another worker, or the queue name is invalid.
+    """
+    if start_data.queue is not None and start_data.queue not in list_queues():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid queue name: {start_data.queue}",
+        )
+
+    try:
+        task, session = await EventOrchestrator.start_task(
+            db, task_id, start_data.worker_id, start_data.session_id
+        )
+    except LookupError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(exc),
+        ) from exc
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(exc),
+        ) from exc
 
     await db.commit()
-    await db.refresh(task)
 
-    return task
+    if start_data.job_id and start_data.queue:
+        await queue_manager.ack_work(start_data.queue, start_data.job_id)
+
+    return TaskStartResponse(
+        task=TaskResponse.model_validate(task),
+        session=SessionResponse.model_validate(session),
+    )
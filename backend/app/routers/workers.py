@@ -1,16 +1,33 @@
 """Worker API endpoints."""
 
+import contextlib
 import uuid
-from datetime import datetime
-from typing import Annotated
+from collections.abc import Sequence
+from typing import Annotated, Any, cast
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import CursorResult, delete, func, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
-from app.models import Worker, WorkerStatus
-from app.schemas.worker import WorkerCreate, WorkerHeartbeat, WorkerResponse
+from app.database import get_db, keyset_paginate, split_page
+from app.models import Task, TaskStatus, Worker, WorkerStatus
+from app.schemas.orm import construct_from_orm
+from app.schemas.queue import WorkOrderClaim
+from app.schemas.session import SessionResponse
+from app.schemas.worker import (
+    WorkerCreate,
+    WorkerHeartbeat,
+    WorkerListResponse,
+    WorkerPoll,
+    WorkerPollResponse,
+    WorkerResponse,
+)
+from app.services.orchestrator import EventOrchestrator
+from app.services.queue_manager import (
+    CLAIM_TIMEOUT,
+    QueueManager,
+    get_queue_manager,
+)
 
 router = APIRouter(prefix="/workers", tags=["workers"])
 
@@ -32,44 +49,69 @@ async def register_worker(
     worker = Worker(
         name=worker_data.name,
         status=WorkerStatus.IDLE,
-        last_heartbeat_at=datetime.utcnow(),
     )
 
     db.add(worker)
     await db.commit()
-    await db.refresh(worker)
 
     return worker
 
 
-@router.get("", response_model=list[WorkerResponse])
+@router.get("", response_model=WorkerListResponse)
 async def list_workers(
     db: Annotated[AsyncSession, Depends(get_db)],
     status_filter: WorkerStatus | None = None,
-) -> list[Worker]:
-    """List all workers.
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
+    cursor: str | None = None,
+) -> Response:
+    """List workers with optional filtering, newest first.
 
     Args:
         db: Database session.
         status_filter: Optional status filter.
+        limit: Maximum number of results.
+        cursor: ``next_cursor`` of the previous page.
 
     Returns:
-        list[Worker]: List of workers.
+        Response: Serialized WorkerListResponse with the page of workers
+            and the cursor of the next page.
+
+    Raises:
+        HTTPException: If the cursor is invalid.
     """
-    query = select(Worker).order_by(Worker.created_at.desc())
+    # Built from lambdas so the compiled SQL is cached per query shape
+    stmt = lambda_stmt(lambda: select(Worker))
 
     if status_filter:
-        query = query.where(Worker.status == status_filter)
+        stmt += lambda s: s.where(Worker.status == status_filter)
 
-    result = await db.execute(query)
-    return list(result.scalars().all())
+    try:
+        stmt = keyset_paginate(stmt, Worker, cursor, limit)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+
+    result = await db.execute(stmt)
+    # Lambda statements lose the row type, so it is restated here
+    rows: Sequence[Worker] = result.scalars().all()
+    items, next_cursor = split_page(rows, limit)
+
+    # Rows are already typed by the ORM; serialize them straight to JSON
+    # without the response validation FastAPI would otherwise run
+    page = WorkerListResponse.model_construct(
+        items=[construct_from_orm(WorkerResponse, row) for row in items],
+        next_cursor=next_cursor,
+    )
+    return Response(page.model_dump_json(), media_type="application/json")
 
 
 @router.get("/{worker_id}", response_model=WorkerResponse)
 async def get_worker(
     worker_id: uuid.UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> Worker:
+) -> Response:
     """Get worker by ID.
 
     Args:
@@ -77,7 +119,7 @@ async def get_worker(
         db: Database session.
 
     Returns:
-        Worker: Worker instance.
+        Response: Serialized WorkerResponse.
 
     Raises:
         HTTPException: If worker not found.
@@ -90,6 +132,44 @@ async def get_worker(
             detail=f"Worker {worker_id} not found",
         )
 
+    body = construct_from_orm(WorkerResponse, worker).model_dump_json()
+    return Response(body, media_type="application/json")
+
+
+async def _record_heartbeat(
+    db: AsyncSession, worker_id: uuid.UUID, worker_status: WorkerStatus
+) -> Worker:
+    """Update a worker's status and heartbeat and commit.
+
+    Args:
+        db: Database session.
+        worker_id: Worker UUID.
+        worker_status: Reported worker status.
+
+    Returns:
+        Worker: Updated worker.
+
+    Raises:
+        HTTPException: If worker not found.
+    """
+    # Update status and heartbeat and read the row back in a single statement
+    stmt = (
+        update(Worker)
+        .where(Worker.id == worker_id)
+        .values(status=worker_status, last_heartbeat_at=func.now())
+        .returning(Worker)
+    )
+    result = await db.execute(stmt)
+    worker = result.scalar_one_or_none()
+
+    if not worker:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Worker {worker_id} not found",
+        )
+
+    await db.commit()
+
     return worker
 
 
@@ -112,22 +192,116 @@ async def worker_heartbeat(
     Raises:
         HTTPException: If worker not found.
     """
-    worker = await db.get(Worker, worker_id)
+    return await _record_heartbeat(db, worker_id, heartbeat_data.status)
 
-    if not worker:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Worker {worker_id} not found",
+
+async def _settle_unstarted_claim(
+    db: AsyncSession, queue_manager: QueueManager, work: dict[str, Any]
+) -> None:
+    """Settle the claim of a job whose task failed to start on the poll.
+
+    The job goes back on its queue for another worker if its task is
+    still queued. A task that is gone, or already running or finished
+    elsewhere, would only fail to start again, so its job is dropped.
+
+    Args:
+        db: Database session, rolled back.
+        queue_manager: Shared queue manager.
+        work: Claimed work order.
+    """
+    await db.rollback()
+    task_status = None
+    with contextlib.suppress(ValueError):
+        task_status = await db.scalar(
+            select(Task.status).where(Task.id == uuid.UUID(work["data"]["task_id"]))
         )
+    if task_status == TaskStatus.QUEUED:
+        await queue_manager.release_work(work["queue"], work["job_id"])
+    else:
+        await queue_manager.ack_work(work["queue"], work["job_id"])
 
-    # Update status and heartbeat
-    worker.status = heartbeat_data.status
-    worker.last_heartbeat_at = datetime.utcnow()
 
-    await db.commit()
-    await db.refresh(worker)
+@router.post("/{worker_id}/poll", response_model=WorkerPollResponse)
+async def poll_worker(
+    worker_id: uuid.UUID,
+    poll_data: WorkerPoll,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    queue_manager: Annotated[QueueManager, Depends(get_queue_manager)],
+) -> WorkerPollResponse:
+    """Record a worker heartbeat and claim its next work order.
+
+    Saves the worker a round trip per poll cycle over calling the
+    heartbeat and claim endpoints separately. Work is only claimed once
+    the heartbeat is committed, so unknown workers never take a job; if
+    the queues are empty, the claim long-polls for up to ``wait`` seconds
+    (``CLAIM_TIMEOUT`` by default).
+
+    If the worker sends its ``session_id``, a claimed task is also started
+    in that session right away, as ``POST /tasks/{id}/start`` would, so
+    the worker can run it without another request. Either way, the claim
+    is acknowledged once the task starts. If starting it here fails, the
+    job is put back on its queue while its task is still queued.
 
-    return worker
+    Args:
+        worker_id: Worker UUID.
+        poll_data: Reported status and queues to claim from.
+        db: Database session.
+        queue_manager: Shared queue manager.
+
+    Returns:
+        WorkerPollResponse: Updated worker and the claimed work order, if
+            any.
+
+    Raises:
+        HTTPException: If worker not found, a queue name is invalid, or
+            the claimed task or session belongs to another worker.
+    """
+    worker = await _record_heartbeat(db, worker_id, poll_data.status)
+    try:
+        work = await queue_manager.claim_work(
+            poll_data.queue_names,
+            timeout=CLAIM_TIMEOUT if poll_data.wait is None else poll_data.wait,
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+
+    started = None
+    task_id = work["data"].get("task_id") if work else None
+    if work and task_id and poll_data.session_id:
+        try:
+            started = await EventOrchestrator.start_task(
+                db, uuid.UUID(task_id), worker_id, poll_data.session_id
+            )
+            await db.commit()
+        except LookupError as exc:
+            await _settle_unstarted_claim(db, queue_manager, work)
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=str(exc),
+            ) from exc
+        except ValueError as exc:
+            await _settle_unstarted_claim(db, queue_manager, work)
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=str(exc),
+            ) from exc
+        except Exception:
+            await _settle_unstarted_claim(db, queue_manager, work)
+            raise
+
+    if work and (started or not task_id):
+        # Nothing is left to start; otherwise the claim stays leased until
+        # the worker starts the task with POST /tasks/{id}/start
+        await queue_manager.ack_work(work["queue"], work["job_id"])
+
+    return WorkerPollResponse(
+        worker=WorkerResponse.model_validate(worker),
+        work=WorkOrderClaim(**work) if work else None,
+        session=SessionResponse.model_validate(started[1]) if started else None,
+    )
 
 
 @router.delete("/{worker_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -144,13 +318,14 @@ async def deregister_worker(
     Raises:
         HTTPException: If worker not found.
     """
-    worker = await db.get(Worker, worker_id)
+    # Sessions and executions are removed by the ON DELETE CASCADE foreign
+    # keys, and claimed work orders are released by ON DELETE SET NULL
+    result = await db.execute(delete(Worker).where(Worker.id == worker_id))
 
-    if not worker:
+    if cast(CursorResult[Any], result).rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Worker {worker_id} not found",
         )
 
-    await db.delete(worker)
     await db.commit()
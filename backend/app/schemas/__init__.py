@@ -1,19 +1,44 @@
 """Pydantic schemas for API request/response validation."""
 
-from app.schemas.task import TaskCreate, TaskResponse, TaskUpdate
-from app.schemas.worker import WorkerCreate, WorkerHeartbeat, WorkerResponse
-from app.schemas.session import SessionCreate, SessionResponse
 from app.schemas.chat import ChatMessageCreate, ChatMessageResponse
 from app.schemas.queue import QueueStatsResponse, WorkOrderClaim
+from app.schemas.session import (
+    SessionCreate,
+    SessionListResponse,
+    SessionResponse,
+)
+from app.schemas.task import (
+    TaskCreate,
+    TaskListResponse,
+    TaskResponse,
+    TaskStart,
+    TaskStartResponse,
+    TaskUpdate,
+)
+from app.schemas.worker import (
+    WorkerCreate,
+    WorkerHeartbeat,
+    WorkerListResponse,
+    WorkerPoll,
+    WorkerPollResponse,
+    WorkerResponse,
+)
 
 __all__ = [
     "TaskCreate",
+    "TaskListResponse",
     "TaskResponse",
+    "TaskStart",
+    "TaskStartResponse",
     "TaskUpdate",
     "WorkerCreate",
+    "WorkerListResponse",
+    "WorkerPoll",
+    "WorkerPollResponse",
     "WorkerResponse",
     "WorkerHeartbeat",
     "SessionCreate",
+    "SessionListResponse",
     "SessionResponse",
     "ChatMessageCreate",
     "ChatMessageResponse",
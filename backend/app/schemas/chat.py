@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.chat_message import MessageDirection
 
@@ -29,10 +29,7 @@ class ChatMessageResponse(BaseModel):
     in_reply_to_id: uuid.UUID | None
     created_at: datetime
 
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class WorkerMessageRequest(BaseModel):
@@ -59,3 +56,10 @@ class ConversationResponse(BaseModel):
     content: str
     in_reply_to: str | None
     created_at: str
+
+
+class ConversationListResponse(BaseModel):
+    """Schema for a page of conversation history."""
+
+    items: list[ConversationResponse]
+    next_cursor: str | None = None
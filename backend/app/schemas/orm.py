@@ -0,0 +1,26 @@
+"""Helpers for building response schemas from ORM objects."""
+
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+
+def construct_from_orm(schema: type[SchemaT], obj: Any) -> SchemaT:
+    """Build a response schema from an ORM object without validating it.
+
+    Rows loaded through the typed ORM columns already carry the types the
+    schema declares, so re-validating them on the way out only costs time.
+    Only use this for objects loaded from the database, never for input.
+
+    Args:
+        schema: Response schema class.
+        obj: ORM object exposing every field of ``schema`` as an attribute.
+
+    Returns:
+        SchemaT: Unvalidated schema instance, ready to be serialized.
+    """
+    return schema.model_construct(
+        **{name: getattr(obj, name) for name in schema.model_fields}
+    )
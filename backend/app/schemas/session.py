@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models import SessionStatus
 
@@ -28,7 +28,11 @@ class SessionResponse(BaseModel):
     last_activity_at: datetime
     terminated_at: datetime | None = None
 
-    class Config:
-        """Pydantic config."""
+    model_config = ConfigDict(from_attributes=True)
 
-        from_attributes = True
+
+class SessionListResponse(BaseModel):
+    """Schema for a page of sessions."""
+
+    items: list[SessionResponse]
+    next_cursor: str | None = None
@@ -3,9 +3,10 @@
 import uuid
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models import TaskPriority, TaskStatus, TaskType
+from app.schemas.session import SessionResponse
 
 
 class TaskBase(BaseModel):
@@ -43,7 +44,28 @@ class TaskResponse(TaskBase):
     updated_at: datetime
     completed_at: datetime | None = None
 
-    class Config:
-        """Pydantic config."""
+    model_config = ConfigDict(from_attributes=True)
 
-        from_attributes = True
+
+class TaskListResponse(BaseModel):
+    """Schema for a page of tasks."""
+
+    items: list[TaskResponse]
+    next_cursor: str | None = None
+
+
+class TaskStart(BaseModel):
+    """Schema for a worker starting a task."""
+
+    worker_id: uuid.UUID
+    session_id: str = Field(..., min_length=1, max_length=255)
+    # Claimed job the task came from, acknowledged once the task starts
+    job_id: str | None = None
+    queue: str | None = None
+
+
+class TaskStartResponse(BaseModel):
+    """Schema for a started task and the session running it."""
+
+    task: TaskResponse
+    session: SessionResponse
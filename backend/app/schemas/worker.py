@@ -3,9 +3,11 @@
 import uuid
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models import WorkerStatus
+from app.schemas.queue import WorkOrderClaim
+from app.schemas.session import SessionResponse
 
 
 class WorkerCreate(BaseModel):
@@ -20,6 +22,24 @@ class WorkerHeartbeat(BaseModel):
     status: WorkerStatus
 
 
+# Longest a poll may long-poll for work, in seconds. Kept under typical
+# client and proxy read timeouts (30s+)
+MAX_POLL_WAIT = 25.0
+
+
+class WorkerPoll(BaseModel):
+    """Schema for a worker poll: heartbeat plus work claim."""
+
+    status: WorkerStatus
+    queue_names: list[str] | None = None
+    # Seconds to wait for work if the queues are empty; defaults to the
+    # server's claim timeout
+    wait: float | None = Field(default=None, ge=0, le=MAX_POLL_WAIT)
+    # Claude Code session to start a claimed task in; if set, the task is
+    # marked in progress as part of the claim
+    session_id: str | None = Field(default=None, min_length=1, max_length=255)
+
+
 class WorkerResponse(BaseModel):
     """Schema for worker response."""
 
@@ -30,7 +50,20 @@ class WorkerResponse(BaseModel):
     updated_at: datetime
     last_heartbeat_at: datetime | None = None
 
-    class Config:
-        """Pydantic config."""
+    model_config = ConfigDict(from_attributes=True)
+
+
+class WorkerListResponse(BaseModel):
+    """Schema for a page of workers."""
+
+    items: list[WorkerResponse]
+    next_cursor: str | None = None
+
+
+class WorkerPollResponse(BaseModel):
+    """Schema for worker poll response."""
 
-        from_attributes = True
+    worker: WorkerResponse
+    work: WorkOrderClaim | None = None
+    # Session the claimed task was started in, if it was
+    session: SessionResponse | None = None
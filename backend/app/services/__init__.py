@@ -1,5 +1,5 @@
 """Business logic services."""
 
-from app.services.queue_manager import QueueManager
+from app.services.queue_manager import QueueManager, get_queue_manager
 
-__all__ = ["QueueManager"]
+__all__ = ["QueueManager", "get_queue_manager"]
@@ -9,277 +9,460 @@ Manages the routing of messages between workers and humans:
 - Routes human responses back to workers
 """
 
+import asyncio
+import logging
 import uuid
-from datetime import datetime, timedelta
-from typing import Optional
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import UTC, datetime, timedelta
+from typing import Any, cast
 
+from fastapi import BackgroundTasks
+from sqlalchemy import CursorResult, Row, func, insert, lambda_stmt, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.database import get_sessionmaker, keyset_paginate, split_page, upsert
+from app.models.chat_message import (
+    PENDING_PREDICATE,
+    ChatMessage,
+    MessageDirection,
+)
 from app.models.session import Session, SessionStatus
-from app.models.chat_message import ChatMessage, MessageDirection
-from app.models.task import Task
-from app.models.worker import Worker
+from app.models.task import Task, TaskStatus
+from app.models.worker import Worker, WorkerStatus
 from app.services.queue_manager import QueueManager
 
+logger = logging.getLogger(__name__)
+
+# How often idle sessions are checked, in seconds
+SESSION_CLEANUP_INTERVAL = 300.0
+
 
 class EventOrchestrator:
     """
     Orchestrates communication between workers and humans.
 
+    Stateless: every method is a classmethod taking the request's database
+    session, so routers call them without building an instance.
+
     Phase 1 Implementation:
     - All worker messages are passed through to human chat interface
     - Session mapping maintains context between task and Claude session
     - Session lifecycle management keeps sessions alive when beneficial
     """
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
-        self.queue_manager = QueueManager()
-        # Session keep-alive settings
-        self.session_idle_timeout = timedelta(minutes=30)
-        self.session_max_lifetime = timedelta(hours=4)
+    # Session keep-alive settings
+    session_idle_timeout = timedelta(minutes=30)
+    session_max_lifetime = timedelta(hours=4)
 
+    @classmethod
     async def handle_worker_message(
-        self,
+        cls,
+        db: AsyncSession,
+        queue_manager: QueueManager,
         session_id: str,
         worker_id: uuid.UUID,
         message: str,
-        task_id: Optional[uuid.UUID] = None
+        background_tasks: BackgroundTasks,
+        task_id: uuid.UUID | None = None
     ) -> dict:
         """
         Handle incoming message from worker.
 
         Phase 1: Pass-through mode - all messages go to human chat interface.
 
+        The session upsert (including its activity bump) and the message
+        insert share one transaction, and the message is published to Redis
+        after the response is sent.
+
         Args:
+            db: Database session
+            queue_manager: Shared queue manager
             session_id: Claude Code session ID
             worker_id: Worker UUID
             message: Message content from worker
+            background_tasks: Tasks run after the response is sent
             task_id: Optional task ID (if known)
 
         Returns:
             dict with routing information and chat message ID
         """
         # Get or create session mapping
-        session = await self._get_or_create_session(session_id, worker_id, task_id)
-
-        # Create chat message record
-        chat_message = ChatMessage(
-            session_id=session.id,
-            direction=MessageDirection.WORKER_TO_HUMAN,
-            content=message,
-            sender_worker_id=worker_id,
+        session = await cls._get_or_create_session(
+            db, session_id, worker_id, task_id
         )
-        self.db.add(chat_message)
-        await self.db.commit()
-        await self.db.refresh(chat_message)
 
-        # Update session activity
-        session.last_activity_at = datetime.utcnow()
-        await self.db.commit()
-
-        # Enqueue worker request for human review
-        self.queue_manager.enqueue_worker_request(
+        # Create chat message record as a plain INSERT .. RETURNING; only
+        # the generated id and created_at are needed, so no ORM instance
+        # is built or tracked
+        result = await db.execute(
+            insert(ChatMessage)
+            .values(
+                session_id=session.id,
+                direction=MessageDirection.WORKER_TO_HUMAN,
+                content=message,
+                sender_worker_id=worker_id,
+            )
+            .returning(ChatMessage.id, ChatMessage.created_at)
+        )
+        chat_message = result.one()
+        await db.commit()
+        chat_message_id = str(chat_message.id)
+
+        # Enqueue worker request for human review once committed; the
+        # queue serializer encodes the timestamp, so it's passed as is
+        background_tasks.add_task(
+            queue_manager.enqueue_worker_request,
             chat_message.id,
             {
-                "message_id": str(chat_message.id),
+                "message_id": chat_message_id,
                 "session_id": session_id,
                 "worker_id": str(worker_id),
                 "task_id": str(session.task_id) if session.task_id else None,
                 "message": message,
-                "timestamp": chat_message.created_at.isoformat(),
+                "timestamp": chat_message.created_at,
             }
         )
 
         return {
-            "message_id": str(chat_message.id),
+            "message_id": chat_message_id,
             "session_id": session_id,
             "routed_to": "human",
             "status": "queued_for_human_review",
         }
 
+    @classmethod
     async def handle_human_response(
-        self,
+        cls,
+        db: AsyncSession,
+        queue_manager: QueueManager,
         message_id: uuid.UUID,
         response: str,
+        background_tasks: BackgroundTasks,
     ) -> dict:
         """
         Handle response from human to worker.
 
         Args:
+            db: Database session
+            queue_manager: Shared queue manager
             message_id: Original chat message ID being responded to
             response: Human's response content
+            background_tasks: Tasks run after the response is sent
 
         Returns:
             dict with routing information
+
+        Raises:
+            ValueError: If the original message does not exist
         """
-        # Get original message to find session
-        result = await self.db.execute(
-            select(ChatMessage).where(ChatMessage.id == message_id)
+        # Get original message's session in one query
+        result = await db.execute(
+            select(ChatMessage.session_id, Session.session_id)
+            .join(Session, Session.id == ChatMessage.session_id)
+            .where(ChatMessage.id == message_id)
         )
-        original_message = result.scalar_one_or_none()
+        row = result.one_or_none()
 
-        if not original_message:
+        if row is None:
             raise ValueError(f"Message {message_id} not found")
 
-        # Create response message
-        response_message = ChatMessage(
-            session_id=original_message.session_id,
-            direction=MessageDirection.HUMAN_TO_WORKER,
-            content=response,
-            in_reply_to_id=message_id,
+        session_pk, claude_session_id = row
+
+        # Create response message and bump session activity in one
+        # transaction, both as plain statements
+        result = await db.execute(
+            insert(ChatMessage)
+            .values(
+                session_id=session_pk,
+                direction=MessageDirection.HUMAN_TO_WORKER,
+                content=response,
+                in_reply_to_id=message_id,
+            )
+            .returning(ChatMessage.id, ChatMessage.created_at)
         )
-        self.db.add(response_message)
-        await self.db.commit()
-        await self.db.refresh(response_message)
-
-        # Update session activity
-        result = await self.db.execute(
-            select(Session).where(Session.id == original_message.session_id)
+        response_message = result.one()
+        await db.execute(
+            update(Session)
+            .where(Session.id == session_pk)
+            .values(last_activity_at=func.now())
         )
-        session = result.scalar_one_or_none()
-
-        if session:
-            session.last_activity_at = datetime.utcnow()
-            await self.db.commit()
-
-        # Enqueue response for worker
-        self.queue_manager.enqueue_controller_response(
+        await db.commit()
+        response_message_id = str(response_message.id)
+        original_message_id = str(message_id)
+
+        # Enqueue response for worker once committed; the queue
+        # serializer encodes the timestamp, so it's passed as is
+        background_tasks.add_task(
+            queue_manager.enqueue_controller_response,
             response_message.id,
             {
-                "message_id": str(response_message.id),
-                "original_message_id": str(message_id),
-                "session_id": session.session_id if session else None,
+                "message_id": response_message_id,
+                "original_message_id": original_message_id,
+                "session_id": claude_session_id,
                 "response": response,
-                "timestamp": response_message.created_at.isoformat(),
+                "timestamp": response_message.created_at,
             }
         )
 
         return {
-            "message_id": str(response_message.id),
-            "original_message_id": str(message_id),
+            "message_id": response_message_id,
+            "original_message_id": original_message_id,
             "status": "queued_for_worker",
         }
 
-    async def get_pending_worker_messages(self, limit: int = 50) -> list[dict]:
+    @classmethod
+    async def get_pending_worker_messages(
+        cls, db: AsyncSession, limit: int = 50
+    ) -> list[dict]:
         """
         Get pending messages from workers awaiting human response.
 
-        Returns messages that haven't been replied to yet.
+        Returns messages that haven't been replied to yet, newest first,
+        together with their session in a single query.
+
+        Args:
+            db: Database session
+            limit: Maximum number of messages
         """
-        result = await self.db.execute(
-            select(ChatMessage)
+        reply = aliased(ChatMessage)
+        result = await db.execute(
+            select(
+                ChatMessage.id,
+                ChatMessage.sender_worker_id,
+                ChatMessage.content,
+                ChatMessage.created_at,
+                Session.session_id,
+                Session.task_id,
+            )
+            .join(Session, Session.id == ChatMessage.session_id)
             .where(
-                ChatMessage.direction == MessageDirection.WORKER_TO_HUMAN,
-                ChatMessage.in_reply_to_id.is_(None),  # Not a reply itself
+                # Worker messages that aren't replies themselves, matching
+                # the partial index
+                PENDING_PREDICATE,
+                ~select(reply.id)
+                .where(reply.in_reply_to_id == ChatMessage.id)
+                .exists(),
             )
             .order_by(ChatMessage.created_at.desc())
             .limit(limit)
         )
-        messages = result.scalars().all()
-
-        # Check which messages have responses
-        pending = []
-        for msg in messages:
-            # Check if there's a response
-            response_result = await self.db.execute(
-                select(ChatMessage)
-                .where(ChatMessage.in_reply_to_id == msg.id)
-                .limit(1)
-            )
-            has_response = response_result.scalar_one_or_none() is not None
-
-            if not has_response:
-                # Get session info
-                session_result = await self.db.execute(
-                    select(Session).where(Session.id == msg.session_id)
-                )
-                session = session_result.scalar_one_or_none()
-
-                pending.append({
-                    "message_id": str(msg.id),
-                    "session_id": session.session_id if session else None,
-                    "task_id": str(session.task_id) if session and session.task_id else None,
-                    "worker_id": str(msg.sender_worker_id) if msg.sender_worker_id else None,
-                    "content": msg.content,
-                    "created_at": msg.created_at.isoformat(),
-                })
-
-        return pending
-
-    async def get_session_conversation(self, session_id: str) -> list[dict]:
+
+        return [
+            {
+                "message_id": str(row.id),
+                "session_id": row.session_id,
+                "task_id": str(row.task_id) if row.task_id else None,
+                "worker_id": str(row.sender_worker_id) if row.sender_worker_id else None,
+                "content": row.content,
+                "created_at": row.created_at.isoformat(),
+            }
+            for row in result
+        ]
+
+    @classmethod
+    async def get_session_conversation(
+        cls,
+        db: AsyncSession,
+        session_id: str,
+        cursor: str | None = None,
+        limit: int = 100,
+    ) -> tuple[list[dict], str | None]:
         """
-        Get full conversation for a session.
+        Get one page of the conversation for a session.
+
+        Pages run backwards from the newest message, so the first page is
+        the most recent part of the conversation and each following page
+        is older. Messages within a page are in chronological order.
 
         Args:
+            db: Database session
             session_id: Claude Code session ID
+            cursor: next_cursor of the previous (newer) page
+            limit: Maximum number of messages
 
         Returns:
-            List of messages in chronological order
+            The page of messages and the cursor of the next (older) page,
+            or None if this is the oldest page
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        # Get session
-        result = await self.db.execute(
-            select(Session).where(Session.session_id == session_id)
+        # Built from lambdas so the compiled SQL is cached per query shape.
+        # Only the serialized columns are selected, so rows come back as
+        # plain tuples without building and tracking ORM instances
+        stmt = lambda_stmt(
+            lambda: select(
+                ChatMessage.id,
+                ChatMessage.direction,
+                ChatMessage.content,
+                ChatMessage.in_reply_to_id,
+                ChatMessage.created_at,
+            )
+            .join(Session, Session.id == ChatMessage.session_id)
+            .where(Session.session_id == session_id)
         )
-        session = result.scalar_one_or_none()
+        stmt = keyset_paginate(stmt, ChatMessage, cursor, limit)
 
-        if not session:
-            return []
-
-        # Get all messages for this session
-        result = await self.db.execute(
-            select(ChatMessage)
-            .where(ChatMessage.session_id == session.id)
-            .order_by(ChatMessage.created_at.asc())
-        )
-        messages = result.scalars().all()
+        result = await db.execute(stmt)
+        rows, next_cursor = split_page(result.all(), limit)
 
         return [
             {
-                "message_id": str(msg.id),
-                "direction": msg.direction.value,
-                "content": msg.content,
-                "in_reply_to": str(msg.in_reply_to_id) if msg.in_reply_to_id else None,
-                "created_at": msg.created_at.isoformat(),
+                "message_id": str(row.id),
+                "direction": row.direction.value,
+                "content": row.content,
+                "in_reply_to": str(row.in_reply_to_id) if row.in_reply_to_id else None,
+                "created_at": row.created_at.isoformat(),
             }
-            for msg in messages
-        ]
+            for row in reversed(rows)
+        ], next_cursor
 
+    @classmethod
     async def _get_or_create_session(
-        self,
+        cls,
+        db: AsyncSession,
         session_id: str,
         worker_id: uuid.UUID,
-        task_id: Optional[uuid.UUID] = None,
-    ) -> Session:
-        """Get existing session or create new one."""
-        result = await self.db.execute(
-            select(Session).where(Session.session_id == session_id)
+        task_id: uuid.UUID | None = None,
+    ) -> Row[uuid.UUID, uuid.UUID | None]:
+        """Get existing session or create new one, marking it active.
+
+        Runs as one upsert; an existing session gets its activity bumped
+        and inherits ``task_id`` if it had none. The write is not
+        committed, so it joins the caller's transaction.
+
+        Returns:
+            Row with the session's ``id`` and ``task_id``
+        """
+        insert_stmt = upsert(db, Session).values(
+            session_id=session_id,
+            worker_id=worker_id,
+            task_id=task_id,
+            status=SessionStatus.ACTIVE,
         )
-        session = result.scalar_one_or_none()
-
-        if session:
-            # Update existing session
-            session.last_activity_at = datetime.utcnow()
-            if task_id and not session.task_id:
-                session.task_id = task_id
-            session.status = SessionStatus.ACTIVE
-            await self.db.commit()
-            return session
-
-        # Create new session
-        session = Session(
+        stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[Session.session_id],
+            set_={
+                "status": SessionStatus.ACTIVE,
+                "last_activity_at": func.now(),
+                "task_id": func.coalesce(
+                    Session.task_id, insert_stmt.excluded.task_id
+                ),
+            },
+        ).returning(Session.id, Session.task_id)
+
+        result = await db.execute(stmt)
+        return result.one()
+
+    @classmethod
+    async def start_task(
+        cls,
+        db: AsyncSession,
+        task_id: uuid.UUID,
+        worker_id: uuid.UUID,
+        session_id: str,
+    ) -> tuple[Task, Session]:
+        """
+        Mark a task in progress in a worker's session.
+
+        The session is upserted, so a worker reusing its session for a new
+        task moves it to that task, and the worker is marked busy with its
+        heartbeat bumped. The writes are not committed, so they join the
+        caller's transaction; if a check fails, the caller rolls back.
+
+        Args:
+            db: Database session
+            task_id: Task UUID
+            worker_id: Worker UUID
+            session_id: Claude Code session ID
+
+        Returns:
+            The updated task and session
+
+        Raises:
+            LookupError: If the worker or task does not exist
+            ValueError: If the task already finished or is running in
+                another worker's session, or the session belongs to another
+                worker
+        """
+        # The worker goes first, so a missing one fails before its session
+        # is written. Reading it back also refreshes a copy already loaded
+        # by the caller rather than leaving it expired
+        worker_stmt = (
+            update(Worker)
+            .where(Worker.id == worker_id)
+            .values(status=WorkerStatus.BUSY, last_heartbeat_at=func.now())
+            .returning(Worker)
+            .execution_options(populate_existing=True)
+        )
+        if (await db.execute(worker_stmt)).scalar_one_or_none() is None:
+            raise LookupError(f"Worker {worker_id} not found")
+
+        # A task is owned by the worker whose live session it is attached
+        # to; another worker can't take it over
+        owned_elsewhere = (
+            select(Session.id)
+            .where(
+                Session.task_id == task_id,
+                Session.worker_id != worker_id,
+                Session.status != SessionStatus.TERMINATED,
+            )
+            .exists()
+        )
+        # A completed, failed or cancelled task is never restarted
+        task_stmt = (
+            update(Task)
+            .where(
+                Task.id == task_id,
+                Task.status.in_((TaskStatus.QUEUED, TaskStatus.IN_PROGRESS)),
+                ~owned_elsewhere,
+            )
+            .values(status=TaskStatus.IN_PROGRESS)
+            .returning(Task)
+        )
+        task = (await db.execute(task_stmt)).scalar_one_or_none()
+
+        if task is None:
+            task_status = await db.scalar(
+                select(Task.status).where(Task.id == task_id)
+            )
+            if task_status is None:
+                raise LookupError(f"Task {task_id} not found")
+            if task_status not in (TaskStatus.QUEUED, TaskStatus.IN_PROGRESS):
+                raise ValueError(f"Task {task_id} is already {task_status.value}")
+            raise ValueError(f"Task {task_id} is running on another worker")
+
+        session_insert = upsert(db, Session).values(
             session_id=session_id,
             worker_id=worker_id,
             task_id=task_id,
             status=SessionStatus.ACTIVE,
-            last_activity_at=datetime.utcnow(),
         )
-        self.db.add(session)
-        await self.db.commit()
-        await self.db.refresh(session)
-        return session
+        # Only the worker's own session is taken over. A session already in
+        # the identity map (e.g. from a previous task) is refreshed from the
+        # returned row instead of kept as it was
+        session_stmt = (
+            session_insert.on_conflict_do_update(
+                index_elements=[Session.session_id],
+                set_={
+                    "task_id": session_insert.excluded.task_id,
+                    "status": SessionStatus.ACTIVE,
+                    "last_activity_at": func.now(),
+                },
+                where=Session.worker_id == session_insert.excluded.worker_id,
+            )
+            .returning(Session)
+            .execution_options(populate_existing=True)
+        )
+        session = (await db.execute(session_stmt)).scalar_one_or_none()
+
+        if session is None:
+            raise ValueError(f"Session {session_id} belongs to another worker")
+
+        return task, session
 
-    async def check_and_cleanup_idle_sessions(self) -> dict:
+    @classmethod
+    async def check_and_cleanup_idle_sessions(cls, db: AsyncSession) -> dict:
         """
         Check for idle sessions and terminate them if necessary.
 
@@ -287,39 +470,61 @@ class EventOrchestrator:
         - Mark as IDLE if no activity for session_idle_timeout (30 min)
         - Terminate if idle for too long or max lifetime exceeded
 
+        Args:
+            db: Database session
+
         Returns:
             dict with cleanup statistics
         """
-        now = datetime.utcnow()
-        idle_cutoff = now - self.session_idle_timeout
-        max_lifetime_cutoff = now - self.session_max_lifetime
-
-        # Get active sessions
-        result = await self.db.execute(
-            select(Session).where(Session.status == SessionStatus.ACTIVE)
+        now = datetime.now(UTC)
+        idle_cutoff = now - cls.session_idle_timeout
+        max_lifetime_cutoff = now - cls.session_max_lifetime
+
+        # Both checks run as set-based UPDATEs; sessions past their max
+        # lifetime are terminated first, so they aren't also marked idle
+        terminated = await db.execute(
+            update(Session)
+            .where(
+                Session.status == SessionStatus.ACTIVE,
+                Session.created_at < max_lifetime_cutoff,
+            )
+            .values(status=SessionStatus.TERMINATED, terminated_at=now)
+            .execution_options(synchronize_session=False)
         )
-        active_sessions = result.scalars().all()
+        marked_idle = await db.execute(
+            update(Session)
+            .where(
+                Session.status == SessionStatus.ACTIVE,
+                Session.last_activity_at < idle_cutoff,
+            )
+            .values(status=SessionStatus.IDLE)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
 
-        marked_idle = 0
-        terminated = 0
+        # DML results are cursor results, which carry the matched row count
+        return {
+            "marked_idle": cast(CursorResult[Any], marked_idle).rowcount,
+            "terminated": cast(CursorResult[Any], terminated).rowcount,
+            "checked_at": now.isoformat(),
+        }
 
-        for session in active_sessions:
-            # Check max lifetime
-            if session.created_at < max_lifetime_cutoff:
-                session.status = SessionStatus.TERMINATED
-                session.terminated_at = now
-                terminated += 1
-                continue
 
-            # Check idle timeout
-            if session.last_activity_at < idle_cutoff:
-                session.status = SessionStatus.IDLE
-                marked_idle += 1
+async def cleanup_idle_sessions_periodically(
+    interval: float = SESSION_CLEANUP_INTERVAL,
+) -> None:
+    """Run the idle session check on a fixed interval.
 
-        await self.db.commit()
+    Runs until cancelled; started and stopped by the application lifespan.
+    A failed pass is logged and retried on the next interval.
 
-        return {
-            "marked_idle": marked_idle,
-            "terminated": terminated,
-            "checked_at": now.isoformat(),
-        }
+    Args:
+        interval: Seconds between checks.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with get_sessionmaker()() as db:
+                await EventOrchestrator.check_and_cleanup_idle_sessions(db)
+        except Exception:
+            logger.exception("Idle session cleanup failed")
@@ -1,33 +1,91 @@
 """Queue management service for RQ operations."""
 
+import asyncio
+import logging
+import time
 import uuid
-from datetime import datetime
-from typing import Any
+from collections.abc import Awaitable
+from datetime import UTC, datetime
+from typing import Any, cast
 
+from fastapi import Request
 from rq import Queue
 from rq.job import Job
 
 from app.core.redis import (
-    controller_responses_queue,
-    default_queue,
+    get_blocking_redis,
     get_queue,
-    high_priority_queue,
-    low_priority_queue,
-    worker_requests_queue,
+    get_redis,
+    list_queues,
 )
 from app.models import WorkOrderPriority
 
+logger = logging.getLogger(__name__)
+
+# How long a claim waits for a job to arrive, in seconds
+CLAIM_TIMEOUT = 5.0
+
+# How long a claimed job is held for its worker to start the task before it
+# is put back on its queue, and how often expired claims are looked for, in
+# seconds
+CLAIM_LEASE = 60.0
+CLAIM_REQUEUE_INTERVAL = 30.0
+
+# RQ keys its started registry by "<job id>:<execution id>"; claims are
+# recorded under a fixed execution ID, as no RQ worker executes them
+CLAIM_EXECUTION_ID = "claim"
+
+# Queues whose jobs are claimed by workers
+CLAIMABLE_QUEUES = ("high_priority", "default", "low_priority")
+
+# How long queue statistics are reused before Redis is read again, in seconds
+QUEUE_STATS_TTL = 0.5
+
+# Stats counter name -> RQ queue attribute holding the matching registry
+REGISTRY_COUNTERS = (
+    ("started", "started_job_registry"),
+    ("finished", "finished_job_registry"),
+    ("failed", "failed_job_registry"),
+    ("deferred", "deferred_job_registry"),
+    ("scheduled", "scheduled_job_registry"),
+)
+
+
+def _enqueue(queue: Queue, func: str, *args: Any, **options: Any) -> Job:
+    """Enqueue a job, sending all of its Redis writes in one round trip.
+
+    Without a pipeline, RQ registers the queue and then saves and pushes
+    the job in a separate MULTI/EXEC transaction; both are batched into a
+    single non-transactional pipeline instead.
+
+    Args:
+        queue: Queue to enqueue on.
+        func: Import path of the job function.
+        *args: Positional arguments of the job.
+        **options: Options accepted by ``Queue.enqueue``.
+
+    Returns:
+        Job: Enqueued job.
+    """
+    with queue.connection.pipeline(transaction=False) as pipe:
+        job = queue.enqueue(func, *args, pipeline=pipe, **options)
+        pipe.execute()
+    return job
+
 
 class QueueManager:
     """Manager for Redis queue operations."""
 
     def __init__(self) -> None:
         """Initialize queue manager."""
-        self.high_priority = high_priority_queue
-        self.default = default_queue
-        self.low_priority = low_priority_queue
-        self.worker_requests = worker_requests_queue
-        self.controller_responses = controller_responses_queue
+        self.high_priority = get_queue("high_priority")
+        self.default = get_queue("default")
+        self.low_priority = get_queue("low_priority")
+        self.worker_requests = get_queue("worker_requests")
+        self.controller_responses = get_queue("controller_responses")
+        # Last get_queue_stats result and the monotonic time it expires at
+        self._stats: dict[str, dict[str, int]] | None = None
+        self._stats_expires_at = 0.0
 
     def enqueue_work_order(
         self,
@@ -56,7 +114,8 @@ class QueueManager:
             queue = self.default
 
         # Enqueue work (placeholder function, will be replaced with actual worker execution)
-        job = queue.enqueue(
+        job = _enqueue(
+            queue,
             "worker.execute_task",  # Placeholder
             task_data,
             job_id=str(work_order_id),
@@ -66,7 +125,7 @@ class QueueManager:
             meta={
                 "work_order_id": str(work_order_id),
                 "task_id": task_data.get("task_id"),
-                "enqueued_at": datetime.utcnow().isoformat(),
+                "enqueued_at": datetime.now(UTC),
             },
         )
 
@@ -74,138 +133,285 @@ class QueueManager:
 
     def enqueue_worker_request(
         self,
-        request_id: uuid.UUID,
-        worker_id: uuid.UUID,
-        work_order_id: uuid.UUID,
-        task_id: uuid.UUID,
-        message: str,
-        context: dict[str, Any] | None = None,
+        message_id: uuid.UUID,
+        request_data: dict[str, Any],
     ) -> str:
-        """Enqueue a worker clarification request.
+        """Enqueue a worker message for human review.
 
         Args:
-            request_id: Request UUID.
-            worker_id: Worker UUID.
-            work_order_id: Work order UUID.
-            task_id: Task UUID.
-            message: Request message.
-            context: Additional context.
+            message_id: Chat message UUID, used as the job ID.
+            request_data: Message payload.
 
         Returns:
             str: Job ID.
         """
-        request_data = {
-            "request_id": str(request_id),
-            "worker_id": str(worker_id),
-            "work_order_id": str(work_order_id),
-            "task_id": str(task_id),
-            "message": message,
-            "context": context or {},
-            "created_at": datetime.utcnow().isoformat(),
-        }
-
-        job = self.worker_requests.enqueue(
+        job = _enqueue(
+            self.worker_requests,
             "controller.process_request",  # Placeholder
             request_data,
-            job_id=str(request_id),
+            job_id=str(message_id),
             job_timeout=1800,  # 30 minutes
-            result_ttl=3600,
+            result_ttl=0,  # Pass-through; nothing reads the result
+            failure_ttl=604800,  # Keep failures for 7 days
         )
 
         return job.id
 
     def enqueue_controller_response(
         self,
-        response_id: uuid.UUID,
-        request_id: uuid.UUID,
-        worker_id: uuid.UUID,
-        message: str,
-        generated_by: str = "human",
+        message_id: uuid.UUID,
+        response_data: dict[str, Any],
     ) -> str:
-        """Enqueue a controller response to worker.
+        """Enqueue a human response for delivery to the worker.
 
         Args:
-            response_id: Response UUID.
-            request_id: Original request UUID.
-            worker_id: Worker UUID.
-            message: Response message.
-            generated_by: Source of response (human or automated).
+            message_id: Response chat message UUID, used as the job ID.
+            response_data: Response payload.
 
         Returns:
             str: Job ID.
         """
-        response_data = {
-            "response_id": str(response_id),
-            "request_id": str(request_id),
-            "worker_id": str(worker_id),
-            "message": message,
-            "generated_by": generated_by,
-            "created_at": datetime.utcnow().isoformat(),
-        }
-
-        job = self.controller_responses.enqueue(
+        job = _enqueue(
+            self.controller_responses,
             "worker.receive_response",  # Placeholder
             response_data,
-            job_id=str(response_id),
+            job_id=str(message_id),
             job_timeout=300,
-            result_ttl=3600,
+            result_ttl=0,  # Pass-through; nothing reads the result
+            failure_ttl=604800,  # Keep failures for 7 days
         )
 
         return job.id
 
-    def get_queue_stats(self) -> dict[str, dict[str, int]]:
+    async def get_queue_stats(self) -> dict[str, dict[str, int]]:
         """Get statistics for all queues.
 
+        All counters are read in a single pipelined round-trip on the async
+        client, so the event loop isn't blocked. Registry sizes are read
+        directly with ZCARD, skipping the cleanup pass RQ's
+        ``registry.count`` runs first; expired entries are removed by RQ
+        workers' own maintenance, and expired claims by the claim requeuer.
+
+        The result is reused for ``QUEUE_STATS_TTL`` seconds, so dashboards
+        polling at a high rate share one Redis read.
+
         Returns:
             dict: Queue statistics.
         """
-        queues = [
-            ("high_priority", self.high_priority),
-            ("default", self.default),
-            ("low_priority", self.low_priority),
-            ("worker_requests", self.worker_requests),
-            ("controller_responses", self.controller_responses),
-        ]
+        now = time.monotonic()
+        if self._stats is not None and now < self._stats_expires_at:
+            return self._stats
+
+        queues = [get_queue(name) for name in list_queues()]
+
+        redis_client = await get_redis()
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for queue in queues:
+                pipe.llen(queue.key)
+                for _, registry in REGISTRY_COUNTERS:
+                    pipe.zcard(getattr(queue, registry).key)
+            results = iter(await pipe.execute())
 
         stats = {}
-        for name, queue in queues:
-            stats[name] = {
-                "pending": len(queue),
-                "started": queue.started_job_registry.count,
-                "finished": queue.finished_job_registry.count,
-                "failed": queue.failed_job_registry.count,
-                "deferred": queue.deferred_job_registry.count,
-                "scheduled": queue.scheduled_job_registry.count,
-            }
+        for queue in queues:
+            stats[queue.name] = {"pending": next(results)}
+            for counter, _ in REGISTRY_COUNTERS:
+                stats[queue.name][counter] = next(results)
 
+        self._stats = stats
+        self._stats_expires_at = now + QUEUE_STATS_TTL
         return stats
 
-    def claim_work(self, queue_names: list[str] | None = None) -> dict[str, Any] | None:
+    async def claim_work(
+        self,
+        queue_names: list[str] | None = None,
+        timeout: float = CLAIM_TIMEOUT,
+    ) -> dict[str, Any] | None:
         """Claim next available work order from queues.
 
+        Long-polls with a single BLPOP across the queues, which Redis
+        serves from the first non-empty one in the given order and
+        otherwise holds open until a job arrives or ``timeout`` passes, so
+        a job is picked up as soon as it is enqueued without the worker
+        re-polling.
+
+        The popped job is leased to the worker in its queue's RQ started
+        registry for ``CLAIM_LEASE`` seconds, right after the pop. If the
+        claim is lost on the way to the worker, or the task isn't started,
+        the job goes back on its queue once the lease expires, rather than
+        disappearing. Starting the task acknowledges the claim with
+        :meth:`ack_work`.
+
         Args:
             queue_names: List of queue names to check (in priority order).
+            timeout: Seconds to wait for a job; 0 only checks once.
 
         Returns:
             dict | None: Work order data or None if no work available.
+
+        Raises:
+            ValueError: If a queue name is invalid.
         """
         if queue_names is None:
-            queue_names = ["high_priority", "default", "low_priority"]
-
-        for queue_name in queue_names:
-            try:
-                queue = get_queue(queue_name)
-                job = queue.dequeue()
-
-                if job:
-                    # Return job data
-                    return {
-                        "job_id": job.id,
-                        "queue": queue_name,
-                        "data": job.args[0] if job.args else {},
-                        "meta": job.meta,
-                    }
-            except Exception:
-                continue
-
-        return None
+            queue_names = list(CLAIMABLE_QUEUES)
+
+        queues = {queue.key: queue for queue in map(get_queue, queue_names)}
+
+        if timeout > 0:
+            blocking_client = await get_blocking_redis()
+            # redis-py types its commands for both the sync and the async
+            # client, so the results are cast to what the async one returns
+            popped = await cast(
+                Awaitable[list[str] | None],
+                blocking_client.blpop(list(queues), timeout=timeout),
+            )
+        else:
+            # BLPOP's timeout of 0 would block forever
+            redis_client = await get_redis()
+            popped = None
+            for key in queues:
+                job_id = await cast(Awaitable[str | None], redis_client.lpop(key))
+                if job_id is not None:
+                    popped = [key, job_id]
+                    break
+
+        if popped is None:
+            return None
+
+        key, job_id = popped
+        queue = queues[key]
+        registry_key = queue.started_job_registry.key
+        lease = _lease_member(job_id)
+        redis_client = await get_redis()
+        await cast(
+            Awaitable[int],
+            redis_client.zadd(registry_key, {lease: time.time() + CLAIM_LEASE}),
+        )
+
+        # RQ's client is sync, so the job hash is read off the event loop
+        job = await asyncio.to_thread(queue.fetch_job, job_id)
+
+        # The job hash expired or was deleted while its ID sat in the list
+        if job is None:
+            await cast(Awaitable[int], redis_client.zrem(registry_key, lease))
+            return None
+
+        return {
+            "job_id": job.id,
+            "queue": queue.name,
+            "data": job.args[0] if job.args else {},
+            "meta": job.meta,
+        }
+
+    async def ack_work(self, queue_name: str, job_id: str) -> None:
+        """Acknowledge a claimed job once its task has started.
+
+        Ends the claim's lease, so the job is not requeued.
+
+        Args:
+            queue_name: Queue the job was claimed from.
+            job_id: Claimed job ID.
+
+        Raises:
+            ValueError: If queue name is invalid.
+        """
+        queue = get_queue(queue_name)
+        redis_client = await get_redis()
+        await cast(
+            Awaitable[int],
+            redis_client.zrem(queue.started_job_registry.key, _lease_member(job_id)),
+        )
+
+    async def release_work(self, queue_name: str, job_id: str) -> bool:
+        """Put a claimed job back at the front of its queue.
+
+        Only a job still under lease is requeued, so a claim that was
+        acknowledged or already released is not queued twice.
+
+        Args:
+            queue_name: Queue the job was claimed from.
+            job_id: Claimed job ID.
+
+        Returns:
+            bool: Whether the job was requeued.
+
+        Raises:
+            ValueError: If queue name is invalid.
+        """
+        queue = get_queue(queue_name)
+        redis_client = await get_redis()
+        removed = await cast(
+            Awaitable[int],
+            redis_client.zrem(queue.started_job_registry.key, _lease_member(job_id)),
+        )
+        if not removed:
+            return False
+        await cast(Awaitable[int], redis_client.lpush(queue.key, job_id))
+        return True
+
+    async def requeue_expired_claims(self) -> int:
+        """Requeue claimed jobs whose lease expired before their task started.
+
+        Returns:
+            int: Number of jobs requeued.
+        """
+        redis_client = await get_redis()
+        requeued = 0
+        for queue in map(get_queue, CLAIMABLE_QUEUES):
+            expired = await cast(
+                Awaitable[list[str]],
+                redis_client.zrangebyscore(
+                    queue.started_job_registry.key, "-inf", time.time()
+                ),
+            )
+            for lease in expired:
+                job_id, _, _ = lease.partition(":")
+                if await self.release_work(queue.name, job_id):
+                    requeued += 1
+        return requeued
+
+
+def _lease_member(job_id: str) -> str:
+    """Return the started registry member recording a claim of a job."""
+    return f"{job_id}:{CLAIM_EXECUTION_ID}"
+
+
+async def requeue_expired_claims_periodically(
+    queue_manager: QueueManager,
+    interval: float = CLAIM_REQUEUE_INTERVAL,
+) -> None:
+    """Requeue expired claims on a fixed interval.
+
+    Runs until cancelled; started and stopped by the application lifespan.
+    A failed pass is logged and retried on the next interval.
+
+    Args:
+        queue_manager: Shared queue manager.
+        interval: Seconds between passes.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            requeued = await queue_manager.requeue_expired_claims()
+        except Exception:
+            logger.exception("Requeueing expired claims failed")
+            continue
+        if requeued:
+            logger.warning("Requeued %d expired claims", requeued)
+
+
+async def get_queue_manager(request: Request) -> QueueManager:
+    """Dependency for getting the process-wide queue manager.
+
+    The manager is created once in the application lifespan, so every
+    request reuses the same queues and Redis connection pool. Declared
+    ``async`` so FastAPI resolves it on the event loop instead of
+    dispatching it to the threadpool.
+
+    Args:
+        request: Incoming request.
+
+    Returns:
+        QueueManager: Shared queue manager instance.
+    """
+    return cast(QueueManager, request.app.state.queue_manager)
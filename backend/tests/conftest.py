@@ -0,0 +1,81 @@
+"""Shared test fixtures."""
+
+from collections.abc import AsyncIterator
+
+import fakeredis
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.core import redis
+from app.database import Base, get_db
+from app.main import app
+from app.services.queue_manager import QueueManager, get_queue_manager
+
+
+@pytest.fixture
+async def engine() -> AsyncIterator[AsyncEngine]:
+    """Provide an in-memory SQLite engine with the schema created."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def db(engine: AsyncEngine) -> AsyncIterator[AsyncSession]:
+    """Provide a session on the in-memory engine."""
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+
+
+@pytest.fixture
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> fakeredis.FakeServer:
+    """Point the Redis clients and queues at an in-memory fake server."""
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(
+        redis,
+        "_redis_client",
+        fakeredis.FakeAsyncRedis(server=server, decode_responses=True),
+    )
+    monkeypatch.setattr(
+        redis,
+        "_blocking_redis_client",
+        fakeredis.FakeAsyncRedis(server=server, decode_responses=True),
+    )
+    monkeypatch.setattr(redis, "_sync_redis_client", fakeredis.FakeRedis(server=server))
+    monkeypatch.setattr(redis, "_QUEUES", {})
+    return server
+
+
+@pytest.fixture
+def queue_manager(fake_redis: fakeredis.FakeServer) -> QueueManager:
+    """Provide a queue manager on the fake Redis server."""
+    return QueueManager()
+
+
+@pytest.fixture
+async def client(
+    db: AsyncSession, queue_manager: QueueManager
+) -> AsyncIterator[AsyncClient]:
+    """Provide an API client on the ``db`` session and ``queue_manager``.
+
+    The application lifespan is not run, so no real Redis or database
+    connection is made.
+    """
+
+    async def override_get_db() -> AsyncIterator[AsyncSession]:
+        yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_queue_manager] = lambda: queue_manager
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+    app.dependency_overrides.clear()
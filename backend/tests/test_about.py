@@ -1,8 +1,8 @@
 """Tests for about endpoint."""
 
-import pytest
 from fastapi.testclient import TestClient
 
+from app.core.config import Settings, get_settings
 from app.main import app
 
 client = TestClient(app)
@@ -38,3 +38,14 @@ def test_about_has_correct_content_type() -> None:
     """Test that about endpoint returns JSON content type."""
     response = client.get("/about")
     assert response.headers["content-type"] == "application/json"
+
+
+def test_about_reads_name_from_settings() -> None:
+    """Test that about endpoint takes the application name from settings."""
+    app.dependency_overrides[get_settings] = lambda: Settings(APP_NAME="Renamed")
+    try:
+        response = client.get("/about")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.json()["name"] == "Renamed"
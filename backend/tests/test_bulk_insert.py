@@ -0,0 +1,31 @@
+"""Tests for bulk insert helper."""
+
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import bulk_insert
+from app.models import Worker
+
+
+async def test_bulk_insert_returns_ids_in_row_order(db: AsyncSession) -> None:
+    """Test that bulk insert persists all rows and returns ids in order."""
+    ids = await bulk_insert(
+        db,
+        Worker,
+        [{"name": f"worker-{i}"} for i in range(5)],
+    )
+    await db.commit()
+
+    result = await db.execute(select(Worker.id, Worker.name))
+    names = dict(result.all())
+
+    assert len(ids) == 5
+    assert all(isinstance(worker_id, uuid.UUID) for worker_id in ids)
+    assert [names[worker_id] for worker_id in ids] == [f"worker-{i}" for i in range(5)]
+
+
+async def test_bulk_insert_with_no_rows_returns_empty_list() -> None:
+    """Test that bulk insert skips the round-trip for empty input."""
+    assert await bulk_insert(None, Worker, []) == []  # type: ignore[arg-type]
@@ -0,0 +1,14 @@
+"""Tests for application settings."""
+
+from app.core.config import Settings, get_settings, settings
+
+
+def test_get_settings_returns_settings() -> None:
+    """Test that get_settings returns a Settings instance."""
+    assert isinstance(get_settings(), Settings)
+
+
+def test_get_settings_is_cached() -> None:
+    """Test that get_settings returns the same instance on every call."""
+    assert get_settings() is get_settings()
+    assert get_settings() is settings
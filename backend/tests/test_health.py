@@ -2,7 +2,6 @@
 
 from datetime import datetime
 
-import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
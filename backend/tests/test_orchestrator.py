@@ -0,0 +1,299 @@
+"""Tests for the event orchestrator."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.models import (
+    ChatMessage,
+    MessageDirection,
+    Session,
+    SessionStatus,
+    Task,
+    TaskStatus,
+    Worker,
+    WorkerStatus,
+)
+from app.services.orchestrator import EventOrchestrator
+
+
+async def test_pending_worker_messages_excludes_answered_in_one_query(
+    engine: AsyncEngine, db: AsyncSession
+) -> None:
+    """Test that pending messages skip answered ones without N+1 queries."""
+    worker = Worker(name="worker")
+    db.add(worker)
+    await db.flush()
+    session = Session(session_id="claude-session", worker_id=worker.id)
+    db.add(session)
+    await db.flush()
+
+    messages = [
+        ChatMessage(
+            session_id=session.id,
+            direction=MessageDirection.WORKER_TO_HUMAN,
+            content=f"question {i}",
+            sender_worker_id=worker.id,
+        )
+        for i in range(3)
+    ]
+    db.add_all(messages)
+    await db.flush()
+    db.add(
+        ChatMessage(
+            session_id=session.id,
+            direction=MessageDirection.HUMAN_TO_WORKER,
+            content="answer",
+            in_reply_to_id=messages[1].id,
+        )
+    )
+    await db.commit()
+
+    statements: list[str] = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    pending = await EventOrchestrator.get_pending_worker_messages(db)
+
+    assert len(statements) == 1
+    assert sorted(message["content"] for message in pending) == [
+        "question 0",
+        "question 2",
+    ]
+    assert all(message["session_id"] == "claude-session" for message in pending)
+
+
+async def test_cleanup_marks_idle_and_terminates_expired_sessions(
+    db: AsyncSession,
+) -> None:
+    """Test that cleanup applies the idle and max lifetime policies."""
+    now = datetime.now(UTC)
+    worker = Worker(name="worker")
+    db.add(worker)
+    await db.flush()
+    db.add_all(
+        [
+            Session(session_id="fresh", worker_id=worker.id),
+            Session(
+                session_id="quiet",
+                worker_id=worker.id,
+                last_activity_at=now - timedelta(hours=1),
+            ),
+            Session(
+                session_id="expired",
+                worker_id=worker.id,
+                created_at=now - timedelta(hours=5),
+                last_activity_at=now - timedelta(hours=1),
+            ),
+        ]
+    )
+    await db.commit()
+
+    stats = await EventOrchestrator.check_and_cleanup_idle_sessions(db)
+    result = await db.execute(select(Session.session_id, Session.status))
+    statuses = dict(result.all())
+
+    assert (stats["marked_idle"], stats["terminated"]) == (1, 1)
+    assert statuses == {
+        "fresh": SessionStatus.ACTIVE,
+        "quiet": SessionStatus.IDLE,
+        "expired": SessionStatus.TERMINATED,
+    }
+
+
+async def test_session_conversation_pages_in_one_query(
+    engine: AsyncEngine, db: AsyncSession
+) -> None:
+    """Test that each conversation page is fetched with a single join."""
+    worker = Worker(name="worker")
+    db.add(worker)
+    await db.flush()
+    session = Session(session_id="claude-session", worker_id=worker.id)
+    db.add(session)
+    await db.flush()
+    for i in range(3):
+        db.add(
+            ChatMessage(
+                session_id=session.id,
+                direction=MessageDirection.WORKER_TO_HUMAN,
+                content=f"message {i}",
+                created_at=datetime(2025, 11, 18, 12, i, tzinfo=UTC),
+            )
+        )
+    await db.commit()
+
+    statements: list[str] = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    newest, cursor = await EventOrchestrator.get_session_conversation(
+        db, "claude-session", limit=2
+    )
+    oldest, last_cursor = await EventOrchestrator.get_session_conversation(
+        db, "claude-session", cursor=cursor, limit=2
+    )
+
+    assert len(statements) == 2
+    assert [message["content"] for message in newest] == ["message 1", "message 2"]
+    assert [message["content"] for message in oldest] == ["message 0"]
+    assert last_cursor is None
+
+
+async def test_session_conversation_page_is_read_in_index_order(
+    engine: AsyncEngine,
+) -> None:
+    """Test that a conversation page is an index range scan without a sort."""
+    statements: list[tuple[str, tuple]] = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda *args: statements.append((args[2], args[3])),
+    )
+    async with engine.connect() as conn:
+        async with async_sessionmaker(bind=conn)() as db:
+            await EventOrchestrator.get_session_conversation(db, "claude-session")
+        sql, parameters = statements[-1]
+        result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", parameters)
+        plan = [row[3] for row in result]
+
+    assert any("ix_chat_messages_session_id_created_at_id" in step for step in plan)
+    assert not any("TEMP B-TREE" in step for step in plan)
+
+
+def make_task(title: str) -> Task:
+    """Build a queued task."""
+    return Task(
+        title=title,
+        description="description",
+        repository_url="https://example.com/repo.git",
+        branch_name="main",
+    )
+
+
+async def test_start_task_marks_task_in_progress_in_session(
+    db: AsyncSession,
+) -> None:
+    """Test that starting a task updates the task, session and worker."""
+    worker = Worker(name="worker")
+    task = make_task("task")
+    db.add_all([worker, task])
+    await db.commit()
+
+    started = await EventOrchestrator.start_task(
+        db, task.id, worker.id, "claude-session"
+    )
+    await db.commit()
+
+    started_task, session = started
+    assert started_task.status == TaskStatus.IN_PROGRESS
+    assert (session.session_id, session.worker_id, session.task_id) == (
+        "claude-session",
+        worker.id,
+        task.id,
+    )
+    assert session.status == SessionStatus.ACTIVE
+    # The worker copy loaded in this session is refreshed in place
+    assert worker.status == WorkerStatus.BUSY
+    assert worker.last_heartbeat_at is not None
+
+
+async def test_start_task_moves_reused_session_to_new_task(
+    db: AsyncSession,
+) -> None:
+    """Test that a session reused for another task is reattached to it."""
+    worker = Worker(name="worker")
+    first, second = make_task("first"), make_task("second")
+    db.add_all([worker, first, second])
+    await db.commit()
+
+    first_started = await EventOrchestrator.start_task(
+        db, first.id, worker.id, "claude-session"
+    )
+    second_started = await EventOrchestrator.start_task(
+        db, second.id, worker.id, "claude-session"
+    )
+    await db.commit()
+
+    assert second_started[1].id == first_started[1].id
+    assert second_started[1].task_id == second.id
+    count = await db.scalar(select(func.count()).select_from(Session))
+    assert count == 1
+
+
+async def test_start_task_rejects_unknown_task_or_worker(db: AsyncSession) -> None:
+    """Test that starting with a missing task or worker changes nothing."""
+    worker = Worker(name="worker")
+    task = make_task("task")
+    db.add_all([worker, task])
+    await db.commit()
+    # A rollback expires the instances, so their ids are read up front
+    worker_id, task_id = worker.id, task.id
+
+    with pytest.raises(LookupError):
+        await EventOrchestrator.start_task(
+            db, uuid.uuid4(), worker_id, "claude-session"
+        )
+    await db.rollback()
+    with pytest.raises(LookupError):
+        await EventOrchestrator.start_task(db, task_id, uuid.uuid4(), "claude-session")
+    await db.rollback()
+
+    assert await db.scalar(select(func.count()).select_from(Session)) == 0
+
+
+@pytest.mark.parametrize(
+    "status", [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]
+)
+async def test_start_task_rejects_finished_task(
+    db: AsyncSession, status: TaskStatus
+) -> None:
+    """Test that a task that already finished is not started again."""
+    worker = Worker(name="worker")
+    task = make_task("task")
+    task.status = status
+    db.add_all([worker, task])
+    await db.commit()
+    # A rollback expires the instances, so their ids are read up front
+    worker_id, task_id = worker.id, task.id
+
+    with pytest.raises(ValueError, match=f"already {status.value}"):
+        await EventOrchestrator.start_task(db, task_id, worker_id, "claude-session")
+    await db.rollback()
+
+    assert await db.scalar(select(Task.status).where(Task.id == task_id)) == status
+    assert await db.scalar(select(func.count()).select_from(Session)) == 0
+
+
+async def test_start_task_rejects_another_workers_task_or_session(
+    db: AsyncSession,
+) -> None:
+    """Test that a worker can't take over another worker's task or session."""
+    owner, other = Worker(name="owner"), Worker(name="other")
+    task, next_task = make_task("task"), make_task("next")
+    db.add_all([owner, other, task, next_task])
+    await db.commit()
+    # A rollback expires the instances, so their ids are read up front
+    owner_id, other_id = owner.id, other.id
+    task_id, next_task_id = task.id, next_task.id
+    await EventOrchestrator.start_task(db, task_id, owner_id, "owner-session")
+    await db.commit()
+
+    with pytest.raises(ValueError, match="running on another worker"):
+        await EventOrchestrator.start_task(db, task_id, other_id, "other-session")
+    await db.rollback()
+    with pytest.raises(ValueError, match="belongs to another worker"):
+        await EventOrchestrator.start_task(db, next_task_id, other_id, "owner-session")
+    await db.rollback()
+
+    session = await db.scalar(
+        select(Session).where(Session.session_id == "owner-session")
+    )
+    assert session is not None
+    assert (session.worker_id, session.task_id) == (owner_id, task_id)
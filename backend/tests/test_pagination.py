@@ -0,0 +1,23 @@
+"""Tests for keyset pagination helpers."""
+
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from app.database.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip() -> None:
+    """Test that a decoded cursor yields the encoded sort key."""
+    created_at = datetime(2025, 11, 18, 12, 0, 0, 123456, tzinfo=UTC)
+    row_id = uuid.uuid4()
+
+    assert decode_cursor(encode_cursor(created_at, row_id)) == (created_at, row_id)
+
+
+@pytest.mark.parametrize("cursor", ["", "not-base64!", "bm8tc2VwYXJhdG9y"])
+def test_decode_cursor_rejects_malformed_input(cursor: str) -> None:
+    """Test that malformed cursors raise ValueError."""
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
@@ -0,0 +1,79 @@
+"""Tests for claiming work orders from the queues."""
+
+import uuid
+
+import pytest
+
+from app.core.redis import get_queue
+from app.services import queue_manager as queue_manager_module
+from app.services.queue_manager import QueueManager
+
+
+async def test_claim_leases_job_until_acknowledged(
+    queue_manager: QueueManager,
+) -> None:
+    """Test that a claimed job is started until its claim is acknowledged."""
+    job_id = queue_manager.enqueue_work_order(uuid.uuid4(), {"task_id": "task"})
+    registry = get_queue("default").started_job_registry
+
+    work = await queue_manager.claim_work(timeout=0)
+
+    assert work is not None and work["job_id"] == job_id
+    assert registry.get_job_ids() == [job_id]
+
+    await queue_manager.ack_work("default", job_id)
+
+    assert registry.get_job_ids() == []
+    assert await queue_manager.requeue_expired_claims() == 0
+    assert await queue_manager.claim_work(timeout=0) is None
+
+
+async def test_released_claim_is_claimable_again(
+    queue_manager: QueueManager,
+) -> None:
+    """Test that releasing a claim puts its job back on the queue once."""
+    job_id = queue_manager.enqueue_work_order(uuid.uuid4(), {"task_id": "task"})
+    await queue_manager.claim_work(timeout=0)
+
+    assert await queue_manager.release_work("default", job_id)
+    assert not await queue_manager.release_work("default", job_id)
+
+    work = await queue_manager.claim_work(timeout=0)
+    assert work is not None and work["job_id"] == job_id
+    assert await queue_manager.claim_work(timeout=0) is None
+
+
+async def test_expired_claim_is_requeued(
+    queue_manager: QueueManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a claim never acknowledged goes back on its queue."""
+    monkeypatch.setattr(queue_manager_module, "CLAIM_LEASE", -1.0)
+    job_id = queue_manager.enqueue_work_order(uuid.uuid4(), {"task_id": "task"})
+    await queue_manager.claim_work(timeout=0)
+
+    assert await queue_manager.requeue_expired_claims() == 1
+
+    work = await queue_manager.claim_work(timeout=0)
+    assert work is not None and work["job_id"] == job_id
+
+
+async def test_queue_stats_count_pending_and_claimed_jobs(
+    queue_manager: QueueManager,
+) -> None:
+    """Test that stats count queued jobs as pending and claimed ones as started."""
+    for _ in range(3):
+        queue_manager.enqueue_work_order(uuid.uuid4(), {"task_id": "task"})
+    await queue_manager.claim_work(timeout=0)
+
+    stats = await queue_manager.get_queue_stats()
+
+    assert stats["default"]["pending"] == 2
+    assert stats["default"]["started"] == 1
+    assert stats["high_priority"] == {
+        "pending": 0,
+        "started": 0,
+        "finished": 0,
+        "failed": 0,
+        "deferred": 0,
+        "scheduled": 0,
+    }
@@ -0,0 +1,50 @@
+"""Tests for Redis queue configuration."""
+
+import uuid
+from datetime import UTC, datetime
+
+import fakeredis
+from rq import Queue
+
+from app.core.redis import OrjsonSerializer, bulk_enqueue, get_queue
+
+
+def test_orjson_serializer_round_trips_job_payload() -> None:
+    """Test that job payloads survive serialization as JSON."""
+    job_id = uuid.uuid4()
+    enqueued_at = datetime(2025, 11, 18, 12, 0, tzinfo=UTC)
+
+    data = OrjsonSerializer.dumps(
+        ["worker.execute_task", None, [{"id": job_id, "at": enqueued_at}], {}]
+    )
+
+    assert OrjsonSerializer.loads(data) == [
+        "worker.execute_task",
+        None,
+        [{"id": str(job_id), "at": "2025-11-18T12:00:00+00:00"}],
+        {},
+    ]
+
+
+def test_bulk_enqueue_adds_jobs_in_order(fake_redis: fakeredis.FakeServer) -> None:
+    """Test that jobs enqueued in one pipeline are fetched back intact."""
+    enqueued_at = datetime(2025, 11, 18, 12, 0, tzinfo=UTC)
+    payloads = [{"id": uuid.uuid4(), "at": enqueued_at} for _ in range(3)]
+
+    jobs = bulk_enqueue(
+        "default",
+        [
+            Queue.prepare_data("worker.execute_task", args=(payload,))
+            for payload in payloads
+        ],
+    )
+
+    queue = get_queue("default")
+    assert queue.job_ids == [job.id for job in jobs]
+    for job, payload in zip(jobs, payloads, strict=True):
+        fetched = queue.fetch_job(job.id)
+        assert fetched is not None
+        # JSON has no tuples, so the arguments come back as a list
+        assert fetched.args == [
+            {"id": str(payload["id"]), "at": "2025-11-18T12:00:00+00:00"}
+        ]
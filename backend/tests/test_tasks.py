@@ -0,0 +1,129 @@
+"""Tests for task endpoints."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.redis import get_queue
+from app.models import Task, TaskStatus, Worker, WorkerStatus
+from app.services.queue_manager import QueueManager
+
+
+async def add_worker_and_task(db: AsyncSession) -> tuple[Worker, Task]:
+    """Add an idle worker with a stale heartbeat and a queued task."""
+    worker = Worker(
+        name="worker",
+        last_heartbeat_at=datetime.now(UTC) - timedelta(hours=1),
+    )
+    task = Task(
+        title="task",
+        description="description",
+        repository_url="https://example.com/repo.git",
+        branch_name="main",
+    )
+    db.add_all([worker, task])
+    await db.commit()
+    return worker, task
+
+
+async def test_start_task_also_heartbeats_worker(
+    client: AsyncClient, db: AsyncSession
+) -> None:
+    """Test that starting a task marks the worker busy and bumps its heartbeat."""
+    worker, task = await add_worker_and_task(db)
+    stale_heartbeat = worker.last_heartbeat_at
+
+    response = await client.post(
+        f"/api/v1/tasks/{task.id}/start",
+        json={"worker_id": str(worker.id), "session_id": "claude-session"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["task"]["status"] == TaskStatus.IN_PROGRESS
+    assert data["session"]["task_id"] == str(task.id)
+
+    await db.refresh(worker)
+    assert worker.status == WorkerStatus.BUSY
+    assert stale_heartbeat is not None and worker.last_heartbeat_at is not None
+    assert worker.last_heartbeat_at > stale_heartbeat
+
+
+async def test_start_task_acknowledges_claimed_job(
+    client: AsyncClient, db: AsyncSession, queue_manager: QueueManager
+) -> None:
+    """Test that starting a task ends the lease on the job it was claimed by."""
+    worker, task = await add_worker_and_task(db)
+    queue_manager.enqueue_work_order(uuid.uuid4(), {"task_id": str(task.id)})
+    work = await queue_manager.claim_work(timeout=0)
+    assert work is not None
+
+    response = await client.post(
+        f"/api/v1/tasks/{task.id}/start",
+        json={
+            "worker_id": str(worker.id),
+            "session_id": "claude-session",
+            "job_id": work["job_id"],
+            "queue": work["queue"],
+        },
+    )
+
+    assert response.status_code == 200
+    assert get_queue("default").started_job_registry.get_job_ids() == []
+    assert await queue_manager.requeue_expired_claims() == 0
+
+
+async def test_start_task_rejects_unknown_worker(
+    client: AsyncClient, db: AsyncSession
+) -> None:
+    """Test that a task can't be started by a worker that doesn't exist."""
+    _, task = await add_worker_and_task(db)
+
+    response = await client.post(
+        f"/api/v1/tasks/{task.id}/start",
+        json={"worker_id": str(uuid.uuid4()), "session_id": "claude-session"},
+    )
+
+    assert response.status_code == 404
+
+
+async def test_start_task_rejects_task_running_on_another_worker(
+    client: AsyncClient, db: AsyncSession
+) -> None:
+    """Test that a worker can't start a task another worker is running."""
+    worker, task = await add_worker_and_task(db)
+    other = Worker(name="other")
+    db.add(other)
+    await db.commit()
+
+    first = await client.post(
+        f"/api/v1/tasks/{task.id}/start",
+        json={"worker_id": str(worker.id), "session_id": "claude-session"},
+    )
+    second = await client.post(
+        f"/api/v1/tasks/{task.id}/start",
+        json={"worker_id": str(other.id), "session_id": "other-session"},
+    )
+
+    assert first.status_code == 200
+    assert second.status_code == 409
+
+
+async def test_start_task_rejects_finished_task(
+    client: AsyncClient, db: AsyncSession
+) -> None:
+    """Test that a completed task can't be started again."""
+    worker, task = await add_worker_and_task(db)
+    task.status = TaskStatus.COMPLETED
+    await db.commit()
+
+    response = await client.post(
+        f"/api/v1/tasks/{task.id}/start",
+        json={"worker_id": str(worker.id), "session_id": "claude-session"},
+    )
+
+    assert response.status_code == 409
+    await db.refresh(task)
+    assert task.status == TaskStatus.COMPLETED
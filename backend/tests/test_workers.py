@@ -0,0 +1,100 @@
+"""Tests for worker endpoints."""
+
+import uuid
+
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.redis import get_queue
+from app.models import Session, Task, TaskStatus, Worker, WorkerStatus
+from app.services.queue_manager import QueueManager
+
+
+async def test_poll_starts_claimed_task_in_session(
+    client: AsyncClient, db: AsyncSession, queue_manager: QueueManager
+) -> None:
+    """Test that a poll with a session starts the claimed task in it."""
+    worker = Worker(name="worker")
+    task = Task(
+        title="task",
+        description="description",
+        repository_url="https://example.com/repo.git",
+        branch_name="main",
+    )
+    db.add_all([worker, task])
+    await db.commit()
+
+    job_id = queue_manager.enqueue_work_order(
+        uuid.uuid4(), {"task_id": str(task.id), "title": task.title}
+    )
+
+    response = await client.post(
+        f"/api/v1/workers/{worker.id}/poll",
+        json={"status": "idle", "wait": 0, "session_id": "claude-session"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["work"]["job_id"] == job_id
+    assert data["worker"]["status"] == WorkerStatus.BUSY
+    assert data["session"]["session_id"] == "claude-session"
+    assert data["session"]["task_id"] == str(task.id)
+
+    await db.refresh(task)
+    session = await db.get(Session, uuid.UUID(data["session"]["id"]))
+    assert task.status == TaskStatus.IN_PROGRESS
+    assert session is not None and session.worker_id == worker.id
+    assert get_queue("default").started_job_registry.get_job_ids() == []
+
+
+async def test_poll_requeues_job_when_task_fails_to_start(
+    client: AsyncClient, db: AsyncSession, queue_manager: QueueManager
+) -> None:
+    """Test that a job whose task fails to start on the poll is claimable again."""
+    worker = Worker(name="worker")
+    other = Worker(name="other")
+    task = Task(
+        title="task",
+        description="description",
+        repository_url="https://example.com/repo.git",
+        branch_name="main",
+    )
+    db.add_all([worker, other, task])
+    await db.commit()
+    db.add(Session(session_id="claude-session", worker_id=other.id))
+    await db.commit()
+    worker_id, task_id = worker.id, task.id
+    job_id = queue_manager.enqueue_work_order(
+        uuid.uuid4(), {"task_id": str(task_id), "title": "task"}
+    )
+
+    response = await client.post(
+        f"/api/v1/workers/{worker_id}/poll",
+        json={"status": "idle", "wait": 0, "session_id": "claude-session"},
+    )
+
+    assert response.status_code == 409
+    task_status = await db.scalar(select(Task.status).where(Task.id == task_id))
+    assert task_status == TaskStatus.QUEUED
+    work = await queue_manager.claim_work(timeout=0)
+    assert work is not None and work["job_id"] == job_id
+
+
+async def test_poll_drops_job_for_missing_task(
+    client: AsyncClient, db: AsyncSession, queue_manager: QueueManager
+) -> None:
+    """Test that a job whose task doesn't exist is not requeued."""
+    worker = Worker(name="worker")
+    db.add(worker)
+    await db.commit()
+    queue_manager.enqueue_work_order(uuid.uuid4(), {"task_id": str(uuid.uuid4())})
+
+    response = await client.post(
+        f"/api/v1/workers/{worker.id}/poll",
+        json={"status": "idle", "wait": 0, "session_id": "claude-session"},
+    )
+
+    assert response.status_code == 404
+    assert get_queue("default").started_job_registry.get_job_ids() == []
+    assert await queue_manager.claim_work(timeout=0) is None
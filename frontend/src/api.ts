@@ -4,6 +4,7 @@ import type {
   TaskCreate,
   Worker,
   Session,
+  Page,
   QueueStatsResponse,
   PendingMessage,
   ConversationMessage,
@@ -21,8 +22,8 @@ const api = axios.create({
 
 // Tasks API
 export const getTasks = async (): Promise<Task[]> => {
-  const { data } = await api.get<Task[]>('/api/v1/tasks');
-  return data;
+  const { data } = await api.get<Page<Task>>('/api/v1/tasks');
+  return data.items;
 };
 
 export const getTask = async (id: string): Promise<Task> => {
@@ -37,14 +38,14 @@ export const createTask = async (task: TaskCreate): Promise<Task> => {
 
 // Workers API
 export const getWorkers = async (): Promise<Worker[]> => {
-  const { data } = await api.get<Worker[]>('/api/v1/workers');
-  return data;
+  const { data } = await api.get<Page<Worker>>('/api/v1/workers');
+  return data.items;
 };
 
 // Sessions API
 export const getSessions = async (): Promise<Session[]> => {
-  const { data } = await api.get<Session[]>('/api/v1/sessions');
-  return data;
+  const { data } = await api.get<Page<Session>>('/api/v1/sessions');
+  return data.items;
 };
 
 // Queue API
@@ -60,8 +61,8 @@ export const getPendingMessages = async (): Promise<PendingMessage[]> => {
 };
 
 export const getConversation = async (sessionId: string): Promise<ConversationMessage[]> => {
-  const { data } = await api.get<ConversationMessage[]>(`/api/v1/chat/conversation/${sessionId}`);
-  return data;
+  const { data } = await api.get<Page<ConversationMessage>>(`/api/v1/chat/conversation/${sessionId}`);
+  return data.items;
 };
 
 export const sendHumanResponse = async (response: HumanResponse): Promise<any> => {
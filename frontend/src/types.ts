@@ -48,6 +48,11 @@ export interface Session {
   terminated_at?: string;
 }
 
+export interface Page<T> {
+  items: T[];
+  next_cursor: string | null;
+}
+
 export interface QueueStats {
   pending: number;
   started: number;
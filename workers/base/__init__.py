@@ -1,6 +1,7 @@
 """Worker base classes and utilities."""
 
 from workers.base.config import WorkerConfig
+from workers.base.executor import StubExecutor, TaskExecutor
 from workers.base.worker import Worker
 
-__all__ = ["Worker", "WorkerConfig"]
+__all__ = ["StubExecutor", "TaskExecutor", "Worker", "WorkerConfig"]
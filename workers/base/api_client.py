@@ -16,9 +16,23 @@ class APIClient:
             base_url: Base URL of the backend API.
         """
         self.base_url = base_url.rstrip("/")
-        self.client = httpx.Client(timeout=30.0)
+        # One long-lived client, so every call reuses pooled keep-alive
+        # connections. HTTP/2 is negotiated via ALPN when the backend is
+        # served over TLS, multiplexing concurrent calls on one connection.
+        # A worker has at most a poll and a heartbeat in flight, so the
+        # pool is kept small; failed connection attempts (e.g. while the
+        # backend restarts) are retried before a call gives up.
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+                retries=3,
+            ),
+            timeout=30.0,
+        )
 
-    def register_worker(self, name: str) -> dict[str, Any]:
+    async def register_worker(self, name: str) -> dict[str, Any]:
         """Register worker with backend.
 
         Args:
@@ -30,14 +44,16 @@ class APIClient:
         Raises:
             httpx.HTTPError: If registration fails.
         """
-        response = self.client.post(
-            f"{self.base_url}/api/v1/workers",
+        response = await self.client.post(
+            "/api/v1/workers",
             json={"name": name},
         )
         response.raise_for_status()
         return response.json()
 
-    def send_heartbeat(self, worker_id: uuid.UUID, status: str) -> dict[str, Any]:
+    async def send_heartbeat(
+        self, worker_id: uuid.UUID, status: str
+    ) -> dict[str, Any]:
         """Send heartbeat to backend.
 
         Args:
@@ -50,14 +66,14 @@ class APIClient:
         Raises:
             httpx.HTTPError: If heartbeat fails.
         """
-        response = self.client.post(
-            f"{self.base_url}/api/v1/workers/{worker_id}/heartbeat",
+        response = await self.client.post(
+            f"/api/v1/workers/{worker_id}/heartbeat",
             json={"status": status},
         )
         response.raise_for_status()
         return response.json()
 
-    def claim_work(self, queue_names: list[str]) -> dict[str, Any] | None:
+    async def claim_work(self, queue_names: list[str]) -> dict[str, Any] | None:
         """Claim work from queue.
 
         Args:
@@ -69,8 +85,8 @@ class APIClient:
         Raises:
             httpx.HTTPError: If claim request fails.
         """
-        response = self.client.post(
-            f"{self.base_url}/api/v1/queue/claim",
+        response = await self.client.post(
+            "/api/v1/queue/claim",
             params={"queue_names": queue_names},
         )
         response.raise_for_status()
@@ -78,7 +94,47 @@ class APIClient:
         data = response.json()
         return data if data else None
 
-    def update_task_status(
+    async def poll(
+        self,
+        worker_id: uuid.UUID,
+        status: str,
+        queue_names: list[str],
+        wait: float | None = None,
+        session_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Send heartbeat and claim work in a single request.
+
+        Args:
+            worker_id: Worker UUID.
+            status: Worker status.
+            queue_names: List of queue names to check.
+            wait: Seconds the backend waits for work if the queues are
+                empty, or None for its default. Must stay below the
+                client timeout.
+            session_id: Claude Code session to start a claimed task in,
+                or None to leave the task to ``start_task``.
+
+        Returns:
+            dict: Updated worker data under ``worker``, the claimed work
+                order (or None) under ``work`` and, if the task was
+                started, its session under ``session``.
+
+        Raises:
+            httpx.HTTPError: If the poll fails.
+        """
+        response = await self.client.post(
+            f"/api/v1/workers/{worker_id}/poll",
+            json={
+                "status": status,
+                "queue_names": queue_names,
+                "wait": wait,
+                "session_id": session_id,
+            },
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def update_task_status(
         self, task_id: uuid.UUID, status: str
     ) -> dict[str, Any]:
         """Update task status.
@@ -93,14 +149,53 @@ class APIClient:
         Raises:
             httpx.HTTPError: If update fails.
         """
-        response = self.client.patch(
-            f"{self.base_url}/api/v1/tasks/{task_id}",
+        response = await self.client.patch(
+            f"/api/v1/tasks/{task_id}",
             json={"status": status},
         )
         response.raise_for_status()
         return response.json()
 
-    def create_session(
+    async def start_task(
+        self,
+        task_id: uuid.UUID,
+        worker_id: uuid.UUID,
+        session_id: str,
+        job_id: str | None = None,
+        queue: str | None = None,
+    ) -> dict[str, Any]:
+        """Mark a task in progress and attach it to a session.
+
+        Creates the session mapping if it doesn't exist yet, and
+        acknowledges the claimed job once the task has started.
+
+        Args:
+            task_id: Task UUID.
+            worker_id: Worker UUID.
+            session_id: Claude Code session ID.
+            job_id: ID of the claimed job the task was given by.
+            queue: Queue the job was claimed from.
+
+        Returns:
+            dict: Updated task data under ``task`` and session data under
+                ``session``.
+
+        Raises:
+            httpx.HTTPError: If the request fails.
+        """
+        response = await self.client.post(
+            f"/api/v1/tasks/{task_id}/start",
+            json={
+                "worker_id": str(worker_id),
+                "session_id": session_id,
+                "job_id": job_id,
+                "queue": queue,
+            },
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def create_session(
         self,
         session_id: str,
         worker_id: uuid.UUID,
@@ -119,8 +214,8 @@ class APIClient:
         Raises:
             httpx.HTTPError: If creation fails.
         """
-        response = self.client.post(
-            f"{self.base_url}/api/v1/sessions",
+        response = await self.client.post(
+            "/api/v1/sessions",
             json={
                 "session_id": session_id,
                 "worker_id": str(worker_id),
@@ -130,7 +225,7 @@ class APIClient:
         response.raise_for_status()
         return response.json()
 
-    def session_heartbeat(self, session_id: uuid.UUID) -> dict[str, Any]:
+    async def session_heartbeat(self, session_id: uuid.UUID) -> dict[str, Any]:
         """Update session activity.
 
         Args:
@@ -142,13 +237,13 @@ class APIClient:
         Raises:
             httpx.HTTPError: If update fails.
         """
-        response = self.client.post(
-            f"{self.base_url}/api/v1/sessions/{session_id}/heartbeat"
+        response = await self.client.post(
+            f"/api/v1/sessions/{session_id}/heartbeat"
         )
         response.raise_for_status()
         return response.json()
 
-    def deregister_worker(self, worker_id: uuid.UUID) -> None:
+    async def deregister_worker(self, worker_id: uuid.UUID) -> None:
         """Deregister worker from backend.
 
         Args:
@@ -157,11 +252,11 @@ class APIClient:
         Raises:
             httpx.HTTPError: If deregistration fails.
         """
-        response = self.client.delete(
-            f"{self.base_url}/api/v1/workers/{worker_id}"
+        response = await self.client.delete(
+            f"/api/v1/workers/{worker_id}"
         )
         response.raise_for_status()
 
-    def close(self) -> None:
+    async def close(self) -> None:
         """Close HTTP client."""
-        self.client.close()
+        await self.client.aclose()
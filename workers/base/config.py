@@ -16,8 +16,9 @@ class WorkerConfig:
     redis_url: str = "redis://localhost:6379/0"
 
     # Behavior
-    poll_interval: int = 10  # seconds between polls
-    heartbeat_interval: int = 30  # seconds between heartbeats
+    poll_interval: int = 10  # seconds to back off after a failed poll
+    claim_timeout: int = 25  # seconds a poll waits for work (max 25)
+    heartbeat_interval: int = 10  # seconds between heartbeats outside polls
     task_timeout: int = 3600  # seconds (1 hour)
 
     # Queues to poll (in priority order)
@@ -0,0 +1,61 @@
+"""Task executors run the work of a claimed task."""
+
+import asyncio
+import logging
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+
+class TaskExecutor(Protocol):
+    """Strategy that performs a task for the worker.
+
+    The worker handles claiming, task status and heartbeats around it, so
+    an executor only does the work itself. It runs on the worker's event
+    loop and must not block it: long-running work should be awaited, e.g.
+    a subprocess via ``asyncio.create_subprocess_exec``.
+    """
+
+    async def execute(self, task_data: dict[str, Any]) -> None:
+        """Execute a task.
+
+        Args:
+            task_data: Task data from the work order.
+
+        Raises:
+            Exception: If the task fails; the worker marks it failed.
+        """
+        ...
+
+
+class StubExecutor:
+    """Placeholder executor that logs the task and simulates work.
+
+    Stands in until Claude Code is integrated.
+    """
+
+    def __init__(self, duration: float = 5.0) -> None:
+        """Initialize executor.
+
+        Args:
+            duration: Seconds of simulated work per task.
+        """
+        self.duration = duration
+
+    async def execute(self, task_data: dict[str, Any]) -> None:
+        """Log the task and sleep for the simulated duration.
+
+        Args:
+            task_data: Task data from the work order.
+        """
+        logger.info("Task execution stub for: %s", task_data.get("title"))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Task details: repository=%s, branch=%s, type=%s",
+                task_data.get("repository_url"),
+                task_data.get("branch_name"),
+                task_data.get("task_type"),
+            )
+
+        # Simulate work
+        await asyncio.sleep(self.duration)
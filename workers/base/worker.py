@@ -1,27 +1,47 @@
 """Base worker implementation."""
 
+import asyncio
+import contextlib
 import logging
+import random
 import time
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
 
 from workers.base.api_client import APIClient
 from workers.base.config import WorkerConfig
+from workers.base.executor import StubExecutor, TaskExecutor
 
 logger = logging.getLogger(__name__)
 
+# Bounds of the main loop's error back-off, in seconds. The delay doubles
+# on each consecutive error and a random part of it is slept, so workers
+# don't all retry a recovering backend at the same moment
+ERROR_BACKOFF_MIN = 1.0
+ERROR_BACKOFF_MAX = 60.0
+
 
 class Worker:
     """Base worker for executing tasks from the queue."""
 
-    def __init__(self, config: WorkerConfig) -> None:
+    def __init__(
+        self,
+        config: WorkerConfig,
+        executor: TaskExecutor | None = None,
+        api_client: APIClient | None = None,
+    ) -> None:
         """Initialize worker.
 
         Args:
             config: Worker configuration.
+            executor: Executor performing claimed tasks; defaults to the
+                placeholder StubExecutor.
+            api_client: Client for the backend API; defaults to one for
+                ``config.api_url``.
         """
         self.config = config
+        self.executor = executor or StubExecutor()
         self.worker_id: uuid.UUID | None = None
         self.session_id: str | None = None
         self.session_db_id: uuid.UUID | None = None
@@ -29,155 +49,302 @@ class Worker:
         self.status = "idle"
         self.running = False
 
+        # Status last accepted by the backend, and an event that wakes the
+        # heartbeat task to re-check it: set whenever status changes, so a
+        # changed status is reported right away, and when a poll ends
+        self.reported_status: str | None = None
+        self._wake_heartbeat = asyncio.Event()
+
+        # Whether a poll is waiting on the backend. The backend records the
+        # poll's heartbeat on arrival and holds it open while it waits for
+        # work, so no separate heartbeat is needed meanwhile
+        self._poll_in_flight = False
+
+        # Current upper bound of the error back-off; reset once a loop
+        # iteration succeeds
+        self._error_backoff = ERROR_BACKOFF_MIN
+
         # Initialize API client
-        self.api_client = APIClient(config.api_url)
+        self.api_client = api_client or APIClient(config.api_url)
 
-        # Timestamps
-        self.last_heartbeat: datetime | None = None
-        self.start_time = datetime.utcnow()
+        # Timestamps. Intervals are measured on the monotonic clock, which
+        # wall clock adjustments (NTP, DST) can't move; the wall clock
+        # start time is only kept for display
+        self.last_heartbeat: float | None = None
+        self.start_time = datetime.now(timezone.utc)
 
-    def register(self) -> None:
+    async def register(self) -> None:
         """Register worker with backend."""
         try:
             logger.info(f"Registering worker: {self.config.name}")
-            data = self.api_client.register_worker(self.config.name)
+            data = await self.api_client.register_worker(self.config.name)
             self.worker_id = uuid.UUID(data["id"])
+            # Registration sets the initial heartbeat on the backend
+            self.last_heartbeat = time.monotonic()
+            self.reported_status = data["status"]
+            # For now, use a simple session ID (will be replaced with actual Claude Code session)
+            self.session_id = f"session-{self.worker_id}-{int(time.time())}"
             logger.info(f"Worker registered with ID: {self.worker_id}")
         except Exception as e:
             logger.error(f"Failed to register worker: {e}")
             raise
 
-    def send_heartbeat(self) -> None:
-        """Send heartbeat to backend."""
+    async def poll(self) -> dict[str, Any] | None:
+        """Send heartbeat and claim next available work order.
+
+        The backend starts a claimed task in the worker's session as part
+        of the claim; the session is then returned under the work order's
+        ``session`` key.
+
+        Returns:
+            dict | None: Work order data or None if no work available.
+        """
         if not self.worker_id:
-            return
+            return None
 
+        # The backend records the heartbeat before it starts waiting for
+        # work, so it dates from when the poll was sent
+        sent_at = time.monotonic()
+        status = self.status
+        self._poll_in_flight = True
         try:
-            self.api_client.send_heartbeat(self.worker_id, self.status)
-            self.last_heartbeat = datetime.utcnow()
-            logger.debug(f"Heartbeat sent: status={self.status}")
+            data = await self.api_client.poll(
+                self.worker_id,
+                status,
+                self.config.queue_names or [],
+                wait=self.config.claim_timeout,
+                session_id=self.session_id,
+            )
         except Exception as e:
-            logger.warning(f"Failed to send heartbeat: {e}")
+            logger.warning("Failed to poll: %s", e)
+            data = None
+        finally:
+            self._poll_in_flight = False
+            self._wake_heartbeat.set()
 
-    def claim_work(self) -> dict[str, Any] | None:
-        """Claim next available work order.
+        if data is None:
+            # Back off before the next poll
+            await asyncio.sleep(self.config.poll_interval)
+            return None
+
+        # A heartbeat sent while the poll was in flight may be newer
+        self.last_heartbeat = max(self.last_heartbeat or sent_at, sent_at)
+        self.reported_status = status
+        logger.debug("Heartbeat sent: status=%s", status)
+
+        work = data["work"]
+        if work:
+            logger.info(
+                "Claimed work: job_id=%s, queue=%s", work["job_id"], work["queue"]
+            )
+            if data.get("session"):
+                # Starting the task marked the worker busy and bumped its
+                # heartbeat as the claim returned
+                self.last_heartbeat = time.monotonic()
+                self.reported_status = "busy"
+                work["session"] = data["session"]
+        return work
+
+    async def send_heartbeat(self) -> bool:
+        """Send a heartbeat with the current status.
 
         Returns:
-            dict | None: Work order data or None if no work available.
+            bool: Whether the heartbeat was accepted.
         """
+        if not self.worker_id:
+            return False
+
+        status = self.status
         try:
-            work = self.api_client.claim_work(self.config.queue_names or [])
-            if work:
-                logger.info(f"Claimed work: job_id={work['job_id']}, queue={work['queue']}")
-            return work
+            await self.api_client.send_heartbeat(self.worker_id, status)
         except Exception as e:
-            logger.error(f"Failed to claim work: {e}")
-            return None
+            logger.warning("Failed to send heartbeat: %s", e)
+            return False
+
+        self.last_heartbeat = time.monotonic()
+        self.reported_status = status
+        logger.debug("Heartbeat sent: status=%s", status)
+        return True
+
+    def set_status(self, status: str) -> None:
+        """Change the worker status and wake the heartbeat to report it.
 
-    def execute_task(self, work_order: dict[str, Any]) -> None:
+        Args:
+            status: New worker status.
+        """
+        if status != self.status:
+            self.status = status
+            self._wake_heartbeat.set()
+
+    async def _heartbeat_forever(self) -> None:
+        """Keep the heartbeat fresh while the main loop is busy.
+
+        Runs alongside the main loop. Polls heartbeat too, and keep the
+        worker fresh for as long as they are in flight, so one is only
+        sent once ``heartbeat_interval`` seconds pass without a poll,
+        which in practice means while a task is executing, or as soon as
+        the status differs from the one last reported (e.g. on turning
+        busy).
+        """
+        while True:
+            if (
+                self.last_heartbeat is not None
+                and self.status == self.reported_status
+            ):
+                remaining: float | None = None
+                if not self._poll_in_flight:
+                    remaining = (
+                        self.last_heartbeat
+                        + self.config.heartbeat_interval
+                        - time.monotonic()
+                    )
+                if remaining is None or remaining > 0:
+                    # Sleep until the heartbeat is due, or indefinitely
+                    # while a poll is in flight
+                    self._wake_heartbeat.clear()
+                    try:
+                        async with asyncio.timeout(remaining):
+                            await self._wake_heartbeat.wait()
+                    except TimeoutError:
+                        pass
+                    continue
+
+            if not await self.send_heartbeat():
+                # Back off before retrying
+                await asyncio.sleep(self.config.poll_interval)
+
+    async def execute_task(self, work_order: dict[str, Any]) -> None:
         """Execute a task.
 
         Args:
             work_order: Work order data from queue.
         """
+        # Not reported by the heartbeat task: starting the task (by the
+        # claim or below) reports the worker busy
         self.status = "busy"
         task_data = work_order["data"]
-        task_id = uuid.UUID(task_data["task_id"])
-        self.current_task_id = task_id
-
-        logger.info(f"Executing task {task_id}: {task_data.get('title')}")
+        task_id: uuid.UUID | None = None
 
         try:
-            # Update task status to in_progress
-            self.api_client.update_task_status(task_id, "in_progress")
-
-            # Create or reuse session
-            if not self.session_id:
-                # For now, use a simple session ID (will be replaced with actual Claude Code session)
-                self.session_id = f"session-{self.worker_id}-{int(time.time())}"
-
-            # Create session mapping in database
-            try:
-                session_data = self.api_client.create_session(
-                    session_id=self.session_id,
-                    worker_id=self.worker_id,
+            # Parsed in here, so a malformed claim fails like a task rather
+            # than breaking the main loop; without an ID it can't be marked
+            # failed on the backend
+            task_id = uuid.UUID(task_data["task_id"])
+            self.current_task_id = task_id
+            logger.info("Executing task %s: %s", task_id, task_data.get("title"))
+
+            session_data = work_order.get("session")
+            if not session_data:
+                # Not started by the claim: mark the task in_progress and
+                # attach it to the session in one request; the backend
+                # creates the session if it's new, and records the
+                # request as a heartbeat reporting busy
+                sent_at = time.monotonic()
+                start_data = await self.api_client.start_task(
                     task_id=task_id,
+                    worker_id=self.worker_id,
+                    session_id=self.session_id,
+                    job_id=work_order.get("job_id"),
+                    queue=work_order.get("queue"),
                 )
-                self.session_db_id = uuid.UUID(session_data["id"])
-                logger.info(f"Session created: {self.session_id}")
-            except Exception as e:
-                logger.warning(f"Session may already exist: {e}")
+                self.last_heartbeat = max(self.last_heartbeat or sent_at, sent_at)
+                self.reported_status = "busy"
+                session_data = start_data["session"]
 
-            # Execute the actual task
-            # For Phase 1, this is a stub - will integrate Claude Code later
-            logger.info(f"Task execution stub for: {task_data.get('title')}")
-            logger.info(f"  Repository: {task_data.get('repository_url')}")
-            logger.info(f"  Branch: {task_data.get('branch_name')}")
-            logger.info(f"  Type: {task_data.get('task_type')}")
+            self.session_db_id = uuid.UUID(session_data["id"])
+            logger.info("Task started in session: %s", self.session_id)
 
-            # Simulate work
-            time.sleep(5)
+            # Execute the actual task. For Phase 1 the default executor is
+            # a stub - will integrate Claude Code later
+            await self.executor.execute(task_data)
 
             # Mark task as completed
-            self.api_client.update_task_status(task_id, "completed")
-            logger.info(f"Task {task_id} completed successfully")
+            await self.api_client.update_task_status(task_id, "completed")
+            logger.info("Task %s completed successfully", task_id)
+
+        except asyncio.CancelledError:
+            # Shut down mid-task: report the task failed rather than leave
+            # it in_progress, then let the cancellation stop the worker
+            logger.warning("Task %s cancelled by shutdown", task_id)
+            if task_id is not None:
+                await self._report_task_failed(task_id)
+            raise
 
         except Exception as e:
-            logger.error(f"Task {task_id} failed: {e}")
-            try:
-                self.api_client.update_task_status(task_id, "failed")
-            except Exception as update_error:
-                logger.error(f"Failed to update task status: {update_error}")
+            logger.error("Task %s failed: %s", task_id or task_data.get("task_id"), e)
+            if task_id is not None:
+                await self._report_task_failed(task_id)
 
         finally:
+            # The poll that follows reports the worker idle
             self.status = "idle"
             self.current_task_id = None
 
-    def run(self) -> None:
+    async def _report_task_failed(self, task_id: uuid.UUID) -> None:
+        """Mark a task failed, logging rather than raising on error.
+
+        Args:
+            task_id: Task UUID.
+        """
+        try:
+            await self.api_client.update_task_status(task_id, "failed")
+        except Exception as update_error:
+            logger.error(f"Failed to update task status: {update_error}")
+
+    async def run(self) -> None:
         """Main worker loop."""
         self.running = True
         logger.info(f"Worker {self.config.name} starting main loop")
+        heartbeat_task: asyncio.Task[None] | None = None
 
         try:
             # Register with backend
-            self.register()
-
-            # Send initial heartbeat
-            self.send_heartbeat()
+            await self.register()
 
-            last_heartbeat_time = time.time()
+            # Heartbeat in the background, so long tasks don't let the
+            # worker look stale
+            heartbeat_task = asyncio.create_task(self._heartbeat_forever())
 
             while self.running:
                 try:
-                    # Send heartbeat if needed
-                    current_time = time.time()
-                    if current_time - last_heartbeat_time >= self.config.heartbeat_interval:
-                        self.send_heartbeat()
-                        last_heartbeat_time = current_time
-
-                    # Try to claim work
-                    work = self.claim_work()
+                    # Heartbeat and try to claim work in one request. The
+                    # backend long-polls until a job arrives or
+                    # claim_timeout passes, so polling again right away
+                    # picks up new work immediately and keeps the
+                    # heartbeat fresh
+                    work = await self.poll()
 
                     if work:
                         # Execute the task
-                        self.execute_task(work)
+                        await self.execute_task(work)
                     else:
-                        # No work available, wait before polling again
-                        logger.debug(f"No work available, sleeping for {self.config.poll_interval}s")
-                        time.sleep(self.config.poll_interval)
+                        logger.debug("No work available, polling again")
+
+                    self._error_backoff = ERROR_BACKOFF_MIN
+                    # Recovered: the next poll reports the worker idle again
+                    if self.status == "error":
+                        self.status = "idle"
 
-                except KeyboardInterrupt:
+                except asyncio.CancelledError:
                     logger.info("Received shutdown signal")
                     break
                 except Exception as e:
-                    logger.error(f"Error in main loop: {e}")
-                    self.status = "error"
-                    time.sleep(60)  # Back off on error
+                    logger.error("Error in main loop: %s", e)
+                    self.set_status("error")
+                    # Back off with full jitter
+                    await asyncio.sleep(random.uniform(0, self._error_backoff))
+                    self._error_backoff = min(
+                        self._error_backoff * 2, ERROR_BACKOFF_MAX
+                    )
 
         finally:
-            self.shutdown()
+            if heartbeat_task:
+                heartbeat_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await heartbeat_task
+            await self.shutdown()
 
-    def shutdown(self) -> None:
+    async def shutdown(self) -> None:
         """Gracefully shutdown worker."""
         logger.info("Shutting down worker")
         self.running = False
@@ -190,12 +357,12 @@ class Worker:
         # Deregister from backend
         if self.worker_id:
             try:
-                self.api_client.deregister_worker(self.worker_id)
+                await self.api_client.deregister_worker(self.worker_id)
                 logger.info("Worker deregistered")
             except Exception as e:
                 logger.error(f"Failed to deregister worker: {e}")
 
         # Close API client
-        self.api_client.close()
+        await self.api_client.close()
 
         logger.info("Worker shutdown complete")
@@ -1,21 +1,65 @@
 """Worker entry point."""
 
 import argparse
+import asyncio
 import logging
+import queue
+import signal
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 from workers.base import Worker, WorkerConfig
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
-)
-
 logger = logging.getLogger(__name__)
 
 
+def configure_logging() -> QueueListener:
+    """Send all logging to stdout through a background thread.
+
+    Records are only put on a queue by the logging call; the returned
+    listener thread writes them to stdout, so the event loop never blocks
+    on the write. Any handlers configured earlier are replaced, so calling
+    this again doesn't duplicate output.
+
+    Returns:
+        QueueListener: Started listener; stop it to flush queued records.
+    """
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+    queue_handler = QueueHandler(log_queue)
+    # The line layout is applied by stdout_handler in the listener
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler], force=True)
+
+    listener = QueueListener(log_queue, stdout_handler)
+    listener.start()
+    return listener
+
+
+async def run_worker(worker: Worker) -> None:
+    """Run a worker until it stops or the process receives SIGTERM.
+
+    SIGTERM cancels the worker the same way Ctrl-C does, interrupting any
+    sleep or long poll at once, so container stops don't wait out the
+    grace period and the worker still deregisters.
+
+    Args:
+        worker: Worker to run.
+    """
+    task = asyncio.current_task()
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGTERM, task.cancel)
+    try:
+        await worker.run()
+    finally:
+        loop.remove_signal_handler(signal.SIGTERM)
+
+
 def main() -> None:
     """Main entry point for worker."""
     parser = argparse.ArgumentParser(description="AgentVine Worker")
@@ -41,13 +85,19 @@ def main() -> None:
         "--poll-interval",
         type=int,
         default=10,
-        help="Poll interval in seconds",
+        help="Seconds to back off after a failed poll",
+    )
+    parser.add_argument(
+        "--claim-timeout",
+        type=int,
+        default=25,
+        help="Seconds each poll waits for work (max 25)",
     )
     parser.add_argument(
         "--heartbeat-interval",
         type=int,
-        default=30,
-        help="Heartbeat interval in seconds",
+        default=10,
+        help="Seconds between heartbeats while no poll is in flight",
     )
 
     args = parser.parse_args()
@@ -58,20 +108,25 @@ def main() -> None:
         api_url=args.api_url,
         redis_url=args.redis_url,
         poll_interval=args.poll_interval,
+        claim_timeout=args.claim_timeout,
         heartbeat_interval=args.heartbeat_interval,
     )
 
     # Create and run worker
     worker = Worker(config)
 
+    listener = configure_logging()
     try:
         logger.info(f"Starting worker: {args.name}")
-        worker.run()
+        asyncio.run(run_worker(worker))
     except KeyboardInterrupt:
         logger.info("Worker stopped by user")
     except Exception as e:
         logger.error(f"Worker failed: {e}", exc_info=True)
         sys.exit(1)
+    finally:
+        # Flush queued records before exiting
+        listener.stop()
 
 
 if __name__ == "__main__":
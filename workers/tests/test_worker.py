@@ -0,0 +1,187 @@
+"""Tests for the base worker."""
+
+import asyncio
+import contextlib
+import uuid
+from typing import Any
+
+from workers.base import Worker, WorkerConfig
+
+
+class FakeAPIClient:
+    """Stand-in for APIClient whose polls hold open like a long poll."""
+
+    def __init__(
+        self, poll_duration: float, work: dict[str, Any] | None = None
+    ) -> None:
+        """Initialize client.
+
+        Args:
+            poll_duration: Seconds each poll waits before returning no work.
+            work: Work order handed out by the first poll.
+        """
+        self.poll_duration = poll_duration
+        self.work = work
+        self.polls: list[str] = []
+        self.heartbeats: list[str] = []
+        self.task_statuses: list[str] = []
+
+    async def register_worker(self, name: str) -> dict[str, Any]:
+        """Register a worker."""
+        return {"id": str(uuid.uuid4()), "name": name, "status": "idle"}
+
+    async def poll(
+        self,
+        worker_id: uuid.UUID,
+        status: str,
+        queue_names: list[str],
+        wait: float | None = None,
+        session_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Record the poll's status and return the work, if any is left.
+
+        Without work, the poll returns once it times out.
+        """
+        self.polls.append(status)
+        work, self.work = self.work, None
+        if work is None:
+            await asyncio.sleep(self.poll_duration)
+        return {"worker": {}, "work": work, "session": None}
+
+    async def start_task(self, task_id: uuid.UUID, **kwargs: Any) -> dict[str, Any]:
+        """Start a task in a new session."""
+        return {"task": {}, "session": {"id": str(uuid.uuid4())}}
+
+    async def update_task_status(
+        self, task_id: uuid.UUID, status: str
+    ) -> dict[str, Any]:
+        """Record the task's new status."""
+        self.task_statuses.append(status)
+        return {}
+
+    async def send_heartbeat(self, worker_id: uuid.UUID, status: str) -> dict[str, Any]:
+        """Record the heartbeat's status."""
+        self.heartbeats.append(status)
+        return {}
+
+    async def deregister_worker(self, worker_id: uuid.UUID) -> None:
+        """Deregister a worker."""
+
+    async def close(self) -> None:
+        """Close the client."""
+
+
+class HangingExecutor:
+    """Executor whose tasks never finish on their own."""
+
+    async def execute(self, task_data: dict[str, Any]) -> None:
+        """Wait until cancelled."""
+        await asyncio.Event().wait()
+
+
+async def run_for(worker: Worker, seconds: float) -> None:
+    """Run a worker's main loop for a while, then stop it."""
+    run = asyncio.create_task(worker.run())
+    await asyncio.sleep(seconds)
+    run.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await run
+
+
+async def test_idle_worker_heartbeats_only_through_polls() -> None:
+    """Test that polls outlasting the heartbeat interval need no heartbeat."""
+    api_client = FakeAPIClient(poll_duration=1.5)
+    worker = Worker(
+        WorkerConfig(name="worker", heartbeat_interval=1),
+        api_client=api_client,  # type: ignore[arg-type]
+    )
+
+    await run_for(worker, 3.2)
+
+    assert len(api_client.polls) >= 2
+    assert api_client.heartbeats == []
+
+
+async def test_status_change_is_reported_during_a_poll() -> None:
+    """Test that a status change wakes the heartbeat task right away."""
+    api_client = FakeAPIClient(poll_duration=5)
+    worker = Worker(
+        WorkerConfig(name="worker"),
+        api_client=api_client,  # type: ignore[arg-type]
+    )
+    run = asyncio.create_task(run_for(worker, 0.5))
+
+    await asyncio.sleep(0.1)
+    worker.set_status("error")
+    await asyncio.sleep(0.1)
+
+    assert api_client.heartbeats == ["error"]
+    await run
+
+
+async def test_shutdown_mid_task_reports_task_failed() -> None:
+    """Test that cancelling the worker during a task doesn't leave it running."""
+    work = {
+        "job_id": "job",
+        "queue": "default",
+        "data": {"task_id": str(uuid.uuid4()), "title": "task"},
+        "meta": {},
+    }
+    api_client = FakeAPIClient(poll_duration=5, work=work)
+    worker = Worker(
+        WorkerConfig(name="worker"),
+        executor=HangingExecutor(),
+        api_client=api_client,  # type: ignore[arg-type]
+    )
+
+    await run_for(worker, 0.2)
+
+    assert api_client.task_statuses == ["failed"]
+    assert worker.current_task_id is None
+
+
+class MalformedPollAPIClient(FakeAPIClient):
+    """Client whose first poll returns a response without a work key."""
+
+    async def poll(
+        self, worker_id: uuid.UUID, status: str, *args: Any, **kwargs: Any
+    ) -> dict[str, Any]:
+        """Return a malformed response once, then poll as usual."""
+        if not self.polls:
+            self.polls.append(status)
+            return {}
+        return await super().poll(worker_id, status, *args, **kwargs)
+
+
+async def test_worker_reports_idle_again_after_an_error() -> None:
+    """Test that the error status is cleared once the main loop recovers."""
+    api_client = MalformedPollAPIClient(poll_duration=0.2)
+    worker = Worker(
+        WorkerConfig(name="worker"),
+        api_client=api_client,  # type: ignore[arg-type]
+    )
+
+    await run_for(worker, 1.5)
+
+    assert api_client.polls[:3] == ["idle", "error", "idle"]
+
+
+async def test_malformed_claim_fails_without_stopping_the_worker() -> None:
+    """Test that a claim with an invalid task ID is handled like a failed task."""
+    work = {
+        "job_id": "job",
+        "queue": "default",
+        "data": {"task_id": "not-a-uuid"},
+        "meta": {},
+    }
+    api_client = FakeAPIClient(poll_duration=0.2, work=work)
+    worker = Worker(
+        WorkerConfig(name="worker"),
+        api_client=api_client,  # type: ignore[arg-type]
+    )
+
+    await run_for(worker, 0.5)
+
+    assert api_client.polls[:2] == ["idle", "idle"]
+    assert api_client.task_statuses == []
+    assert worker.current_task_id is None